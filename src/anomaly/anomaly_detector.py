@@ -1,9 +1,12 @@
 import random
 import os
 import pickle
+import struct
 import logging
 import asyncio
-from typing import Any, Dict, Tuple, Optional, cast
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Optional, cast
 
 # Import centralized error handling
 from core.error_handling import (
@@ -30,6 +33,24 @@ from core.metrics import (
 )
 import time
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import joblib
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 MODEL_PATH: str = os.path.join(os.path.dirname(__file__), "anomaly_if.pkl")
@@ -37,6 +58,18 @@ _MODEL: Optional[Any] = None
 _MODEL_LOADED: bool = False
 _USING_HEURISTIC_MODE: bool = False
 
+# Module-level handle on asyncio.to_thread so tests can swap in a plain
+# coroutine for this module without patching asyncio itself.
+_to_thread = asyncio.to_thread
+
+# Recent model results keyed on rounded features, so quasi-stationary
+# telemetry skips the model call. Entries belong to _predict_cache_owner and
+# are dropped as soon as a different model is in use.
+_PREDICT_CACHE_SIZE: int = 5
+_FEATURE_ROUNDING: Tuple[int, ...] = (2, 1, 3, 2, 1)
+_predict_cache: "OrderedDict[Tuple[float, ...], Tuple[bool, float]]" = OrderedDict()
+_predict_cache_owner: Optional[Any] = None
+
 # Initialize circuit breaker for model loading
 _model_loader_cb: CircuitBreaker = register_circuit_breaker(
     CircuitBreaker(
@@ -49,6 +82,44 @@ _model_loader_cb: CircuitBreaker = register_circuit_breaker(
 )
 
 
+# Heuristic-mode rules, shared by the scalar and batch detectors
+_VOLTAGE_MIN: float = 7.0
+_VOLTAGE_MAX: float = 9.0
+_TEMPERATURE_MAX: float = 40.0
+_GYRO_MAX: float = 0.1
+_VOLTAGE_WEIGHT: float = 0.4
+_TEMPERATURE_WEIGHT: float = 0.3
+_GYRO_WEIGHT: float = 0.3
+_NOISE_MAX: float = 0.1
+_HEURISTIC_THRESHOLD: float = 0.5
+
+
+def _model_artifact_path() -> str:
+    """Prefer a ``.joblib`` export next to MODEL_PATH, else MODEL_PATH itself."""
+    joblib_path = os.path.splitext(MODEL_PATH)[0] + ".joblib"
+    if HAS_JOBLIB and os.path.exists(joblib_path):
+        return joblib_path
+    return MODEL_PATH
+
+
+def _read_model(path: str) -> Any:
+    """
+    Deserialize the model file at ``path``.
+
+    A ``.joblib`` export is loaded with its numpy arrays memory-mapped
+    read-only instead of copied; anything else is unpickled directly. joblib
+    reports a corrupt file as IndexError, ValueError and the like, so those
+    are raised as ``pickle.UnpicklingError`` like a bad pickle.
+    """
+    if HAS_JOBLIB and path.endswith(".joblib"):
+        try:
+            return joblib.load(path, mmap_mode="r")  # noqa: S301 - model file is trusted and part of deployment
+        except (IndexError, KeyError, ValueError, struct.error) as e:
+            raise pickle.UnpicklingError(f"Corrupt joblib model file: {e}") from e
+    with open(path, "rb") as f:
+        return pickle.load(f)  # noqa: S301 - model file is trusted and part of deployment
+
+
 @async_timeout(seconds=get_timeout_config().model_load_timeout)  # type: ignore[misc]
 async def _load_model_impl() -> bool:
     """
@@ -87,27 +158,27 @@ async def _load_model_impl() -> bool:
         return False
 
     # Validate model path exists
-    if not os.path.exists(MODEL_PATH):
-        error_msg = f"Model file not found at {MODEL_PATH}"
+    model_path = _model_artifact_path()
+    if not os.path.exists(model_path):
+        error_msg = f"Model file not found at {model_path}"
         logger.error(
             error_msg,
             extra={
                 "component": "anomaly_detector",
                 "error_type": "ModelLoadError",
-                "model_path": MODEL_PATH
+                "model_path": model_path
             }
         )
         ANOMALY_MODEL_LOAD_ERRORS_TOTAL.inc()
         raise ModelLoadError(
             error_msg,
             component="anomaly_detector",
-            context={"model_path": MODEL_PATH},
+            context={"model_path": model_path},
         )
 
     # Load model with comprehensive error handling
     try:
-        with open(MODEL_PATH, "rb") as f:
-            _MODEL = await asyncio.to_thread(pickle.load, f)  # noqa: S301 - model file is trusted and part of deployment
+        _MODEL = await _to_thread(_read_model, model_path)
         
         # Validate model has required methods
         if not hasattr(_MODEL, 'predict'):
@@ -133,14 +204,14 @@ async def _load_model_impl() -> bool:
             "anomaly_detector",
             {
                 "mode": "model-based",
-                "model_path": MODEL_PATH,
+                "model_path": model_path,
             },
         )
         logger.info(
             "Anomaly detection model loaded successfully",
             extra={
                 "component": "anomaly_detector",
-                "model_path": MODEL_PATH,
+                "model_path": model_path,
                 "model_type": type(_MODEL).__name__
             }
         )
@@ -153,14 +224,14 @@ async def _load_model_impl() -> bool:
             extra={
                 "component": "anomaly_detector",
                 "error_type": type(e).__name__,
-                "model_path": MODEL_PATH
+                "model_path": model_path
             }
         )
         ANOMALY_MODEL_LOAD_ERRORS_TOTAL.inc()
         raise ModelLoadError(
             error_msg,
             component="anomaly_detector",
-            context={"model_path": MODEL_PATH, "pickle_error": str(e)},
+            context={"model_path": model_path, "pickle_error": str(e)},
         )
     
     except OSError as e:
@@ -170,14 +241,14 @@ async def _load_model_impl() -> bool:
             extra={
                 "component": "anomaly_detector",
                 "error_type": "OSError",
-                "model_path": MODEL_PATH
+                "model_path": model_path
             }
         )
         ANOMALY_MODEL_LOAD_ERRORS_TOTAL.inc()
         raise ModelLoadError(
             error_msg,
             component="anomaly_detector",
-            context={"model_path": MODEL_PATH, "os_error": str(e)},
+            context={"model_path": model_path, "os_error": str(e)},
         )
     
     except (AttributeError, TypeError) as e:
@@ -188,7 +259,7 @@ async def _load_model_impl() -> bool:
             extra={
                 "component": "anomaly_detector",
                 "error_type": type(e).__name__,
-                "model_path": MODEL_PATH
+                "model_path": model_path
             },
             exc_info=True
         )
@@ -196,7 +267,7 @@ async def _load_model_impl() -> bool:
         raise ModelLoadError(
             error_msg,
             component="anomaly_detector",
-            context={"model_path": MODEL_PATH, "structure_error": str(e)},
+            context={"model_path": model_path, "structure_error": str(e)},
         )
     except (MemoryError, RuntimeError) as e:
         # Handle resource-related errors during model loading
@@ -206,7 +277,7 @@ async def _load_model_impl() -> bool:
             extra={
                 "component": "anomaly_detector",
                 "error_type": type(e).__name__,
-                "model_path": MODEL_PATH
+                "model_path": model_path
             },
             exc_info=True
         )
@@ -214,7 +285,7 @@ async def _load_model_impl() -> bool:
         raise ModelLoadError(
             error_msg,
             component="anomaly_detector",
-            context={"model_path": MODEL_PATH, "resource_error": str(e)},
+            context={"model_path": model_path, "resource_error": str(e)},
         )
 
 
@@ -395,12 +466,12 @@ def _detect_anomaly_heuristic(data: Dict[str, Any]) -> Tuple[bool, float]:
         temperature: float = float(data.get("temperature", 25.0))
         gyro: float = abs(float(data.get("gyro", 0.0)))
 
-        if voltage < 7.0 or voltage > 9.0:
-            score += 0.4
-        if temperature > 40.0:
-            score += 0.3
-        if gyro > 0.1:
-            score += 0.3
+        if voltage < _VOLTAGE_MIN or voltage > _VOLTAGE_MAX:
+            score += _VOLTAGE_WEIGHT
+        if temperature > _TEMPERATURE_MAX:
+            score += _TEMPERATURE_WEIGHT
+        if gyro > _GYRO_MAX:
+            score += _GYRO_WEIGHT
     except (ValueError, TypeError) as e:
         # invalid data types in heuristic -> treat as anomalous
         logger.warning(
@@ -441,13 +512,188 @@ def _detect_anomaly_heuristic(data: Dict[str, Any]) -> Tuple[bool, float]:
         return True, 0.6
 
     # Add small random noise for simulation realism
-    score += random.uniform(0, 0.1)
+    score += random.uniform(0, _NOISE_MAX)
 
     # Conservative threshold: be more sensitive to potential issues
-    is_anomalous: bool = score > 0.5  # Lowered from 0.6 for more sensitivity
+    is_anomalous: bool = score > _HEURISTIC_THRESHOLD  # Lowered from 0.6 for more sensitivity
     return is_anomalous, min(score, 1.0)  # Cap at 1.0
 
 
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _heuristic_scores_kernel(voltage, temperature, gyro, noise, out):  # pragma: no cover - JIT
+        """Fill out[i] with the uncapped heuristic score of row i (same rule order as scalar)."""
+        for i in range(voltage.size):
+            score = 0.0
+            if voltage[i] < _VOLTAGE_MIN or voltage[i] > _VOLTAGE_MAX:
+                score += _VOLTAGE_WEIGHT
+            if temperature[i] > _TEMPERATURE_MAX:
+                score += _TEMPERATURE_WEIGHT
+            if abs(gyro[i]) > _GYRO_MAX:
+                score += _GYRO_WEIGHT
+            out[i] = score + noise[i]
+
+
+def _detect_anomaly_heuristic_batch(
+    voltage: Any, temperature: Any, gyro: Any, noise: Optional[Any] = None
+) -> Tuple[Any, Any]:
+    """
+    Apply the heuristic rules to many telemetry samples at once.
+
+    Column-wise counterpart of `_detect_anomaly_heuristic` for already-numeric
+    data: one JIT-compiled loop (Numba) or a handful of NumPy array ops
+    instead of one interpreted call per sample.
+
+    Args:
+        voltage: Sequence/array of voltages.
+        temperature: Sequence/array of temperatures (same length).
+        gyro: Sequence/array of gyro rates (same length; sign ignored).
+        noise: Optional per-sample noise in [0, 0.1); drawn uniformly when
+            omitted. Pass zeros for deterministic scores.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (is_anomalous bool array, scores capped at 1.0)
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If the columns have different lengths.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for batch heuristic detection")
+
+    v = np.ascontiguousarray(voltage, dtype=np.float64).ravel()
+    t = np.ascontiguousarray(temperature, dtype=np.float64).ravel()
+    g = np.ascontiguousarray(gyro, dtype=np.float64).ravel()
+    if not (v.size == t.size == g.size):
+        raise ValueError(
+            f"Telemetry columns differ in length: voltage={v.size}, "
+            f"temperature={t.size}, gyro={g.size}"
+        )
+    if noise is None:
+        n = np.random.default_rng().uniform(0.0, _NOISE_MAX, v.size)
+    else:
+        n = np.ascontiguousarray(noise, dtype=np.float64).ravel()
+        if n.size != v.size:
+            raise ValueError(f"noise has length {n.size}, expected {v.size}")
+
+    if HAS_NUMBA:
+        scores = np.empty(v.size, dtype=np.float64)
+        _heuristic_scores_kernel(v, t, g, n, scores)
+    else:
+        scores = (
+            np.where((v < _VOLTAGE_MIN) | (v > _VOLTAGE_MAX), _VOLTAGE_WEIGHT, 0.0)
+            + np.where(t > _TEMPERATURE_MAX, _TEMPERATURE_WEIGHT, 0.0)
+            + np.where(np.abs(g) > _GYRO_MAX, _GYRO_WEIGHT, 0.0)
+            + n
+        )
+
+    return scores > _HEURISTIC_THRESHOLD, np.minimum(scores, 1.0)
+
+
+def _detect_anomaly_heuristic_samples(
+    samples: Any, noise: Optional[Any] = None
+) -> Tuple[Any, Any]:
+    """
+    Apply the heuristic rules to an (N, 3) block of telemetry rows.
+
+    Row-wise entry point for rolling buffers stored as
+    ``[voltage, temperature, gyro]`` rows; delegates to
+    `_detect_anomaly_heuristic_batch`.
+
+    Args:
+        samples: Array-like of shape (N, 3).
+        noise: Optional per-row noise, as for the batch detector.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (is_anomalous bool array, scores capped at 1.0)
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If samples is not an (N, 3) array.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for batch heuristic detection")
+
+    rows = np.asarray(samples, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != 3:
+        raise ValueError(
+            f"Expected telemetry rows of shape (N, 3), got {rows.shape}"
+        )
+    return _detect_anomaly_heuristic_batch(rows[:, 0], rows[:, 1], rows[:, 2], noise)
+
+
+def _predict_cache_key(features: List[float]) -> Optional[Tuple[float, ...]]:
+    """Round a feature row into a cache key, or None if it is not numeric."""
+    try:
+        return tuple(
+            round(float(value), digits)
+            for value, digits in zip(features, _FEATURE_ROUNDING)
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _cached_prediction(
+    model: Any, key: Optional[Tuple[float, ...]]
+) -> Optional[Tuple[bool, float]]:
+    """Return the cached result for ``key`` if it was produced by ``model``."""
+    global _predict_cache_owner
+    if _predict_cache_owner is not model:
+        _predict_cache.clear()
+        _predict_cache_owner = model
+        return None
+    if key is None or key not in _predict_cache:
+        return None
+    _predict_cache.move_to_end(key)
+    return _predict_cache[key]
+
+
+def _cache_prediction(key: Optional[Tuple[float, ...]], result: Tuple[bool, float]) -> None:
+    """Remember ``result`` for ``key``, evicting the oldest entry when full."""
+    if key is None:
+        return
+    _predict_cache[key] = result
+    _predict_cache.move_to_end(key)
+    while len(_predict_cache) > _PREDICT_CACHE_SIZE:
+        _predict_cache.popitem(last=False)
+
+
+_inference_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_inference_pool() -> ThreadPoolExecutor:
+    """Return the single-thread executor that runs every model call."""
+    global _inference_pool
+    if _inference_pool is None:
+        _inference_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="astraguard-ml"
+        )
+    return _inference_pool
+
+
+def _predict_and_score(model: Any, X: List[List[float]]) -> Tuple[Any, Optional[Any]]:
+    """
+    Return ``model.predict(X)`` and ``model.score_samples(X)`` (None if unsupported).
+
+    ``X`` is converted to one float32 array up front, the dtype the tree
+    ensembles evaluate in, so both calls share it instead of each validating
+    and converting the nested list.
+    """
+    if HAS_NUMPY:
+        X = np.asarray(X, dtype=np.float32)
+    scores = model.score_samples(X) if hasattr(model, "score_samples") else None
+    return model.predict(X), scores
+
+
+async def _run_inference(model: Any, features: List[float]) -> Tuple[Any, Optional[Any]]:
+    """Predict and score one feature row in a single hop to the inference thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_inference_pool(), _predict_and_score, model, [features]
+    )
+
+
 @async_timeout(seconds=10.0, operation_name="anomaly_detection")
 async def detect_anomaly(data: Dict[str, Any]) -> Tuple[bool, float]:
     """
@@ -546,19 +792,20 @@ async def detect_anomaly(data: Dict[str, Any]) -> Tuple[bool, float]:
                     data.get("wheel_speed", 5.0),
                 ]
 
-                # Model prediction (assumes binary classifier)
-                is_anomalous = await asyncio.to_thread(_MODEL.predict, [features])
-                is_anomalous = is_anomalous[0]
-                score = (
-                    await asyncio.to_thread(_MODEL.score_samples, [features])
-                    if hasattr(_MODEL, "score_samples")
-                    else [0.5]
-                )
-                score = score[0]
-                # Ensure score is a valid float, default to 0.5 if None
-                if score is None:
-                    score = 0.5
-                score = max(0.0, min(float(score), 1.0))  # Normalize to 0-1
+                cache_key = _predict_cache_key(features)
+                cached = _cached_prediction(_MODEL, cache_key)
+                if cached is not None:
+                    is_anomalous, score = cached
+                else:
+                    # Model prediction (assumes binary classifier)
+                    predictions, scores = await _run_inference(_MODEL, features)
+                    is_anomalous = predictions[0]
+                    score = scores[0] if scores is not None else 0.5
+                    # Ensure score is a valid float, default to 0.5 if None
+                    if score is None:
+                        score = 0.5
+                    score = max(0.0, min(float(score), 1.0))  # Normalize to 0-1
+                    _cache_prediction(cache_key, (bool(is_anomalous), score))
 
                 health_monitor.mark_healthy("anomaly_detector")
 
@@ -43,6 +43,7 @@ from api.models import (
     TokenResponse,
 )
 from core.auth import (
+    APIKeyManager,
     get_auth_manager,
     get_current_user,
     require_admin,
@@ -114,6 +115,7 @@ telemetry_lock: Lock = Lock()
 anomaly_lock: Lock = Lock()
 faults_lock: Lock = Lock()
 start_time: float = time.time()
+_now = time.time  # Clock for chaos fault expiry; tests swap it instead of sleeping
 
 
 # Rate limiting
@@ -325,23 +327,31 @@ app.include_router(contact_router)
 allowed_origins_str = get_secret("allowed_origins") or "http://localhost:3000,http://localhost:8000"
 ALLOWED_ORIGINS = [origin.strip() for origin in allowed_origins_str.split(",")]
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,  # Configured via ALLOWED_ORIGINS env var
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "Accept"],
-)
-
-# Request logging middleware
+# Request logging configuration
 log_level = get_secret("log_level", "INFO")
 sample_rate = float(get_secret("log_sample_rate", "0.1"))  # 10% sampling for high-traffic endpoints
-app.add_middleware(
-    RequestLoggingMiddleware,
-    log_level=log_level,
-    sample_rate=sample_rate,
-)
+
+
+def install_middleware(target: FastAPI) -> None:
+    """Add the CORS and request logging middleware to ``target``."""
+    # CORS middleware
+    target.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,  # Configured via ALLOWED_ORIGINS env var
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "Accept"],
+    )
+
+    # Request logging middleware
+    target.add_middleware(
+        RequestLoggingMiddleware,
+        log_level=log_level,
+        sample_rate=sample_rate,
+    )
+
+
+install_middleware(app)
 
 security = HTTPBasic()
 
@@ -410,7 +420,7 @@ async def check_chaos_injection(fault_type: str) -> bool:
     async with faults_lock:
         if fault_type in active_faults:
             expiration: float = active_faults[fault_type]
-            if time.time() > expiration:
+            if _now() > expiration:
                 del active_faults[fault_type]
                 return False
             return True
@@ -419,7 +429,7 @@ async def check_chaos_injection(fault_type: str) -> bool:
 
 async def cleanup_expired_faults() -> None:
     """Clean up expired chaos faults."""
-    current_time: float = time.time()
+    current_time: float = _now()
     async with faults_lock:
         expired: List[str] = [k for k, v in active_faults.items() if current_time > v]
         for k in expired:
@@ -428,7 +438,7 @@ async def cleanup_expired_faults() -> None:
 
 async def inject_chaos_fault(fault_type: str, duration_seconds: int) -> Dict[str, Any]:
     """Inject a chaos fault for the specified duration."""
-    expiration: float = time.time() + duration_seconds
+    expiration: float = _now() + duration_seconds
     async with faults_lock:
         active_faults[fault_type] = expiration
     return {
@@ -1122,18 +1132,27 @@ async def get_anomaly_history(
 
 
 # Authentication endpoints
+def auth_manager_dependency() -> APIKeyManager:
+    """Resolve the auth manager per request so tests can override it."""
+    return get_auth_manager()
+
+
 @app.post("/api/v1/auth/login", response_model=TokenResponse)
-async def login(request: LoginRequest) -> TokenResponse:
+async def login(
+    request: LoginRequest, auth_manager: APIKeyManager = Depends(auth_manager_dependency)
+) -> TokenResponse:
     """Authenticate user and return JWT token."""
-    auth_manager = get_auth_manager()
     token = auth_manager.authenticate_user(request.username, request.password)
     return TokenResponse(access_token=token, token_type="bearer")
 
 
 @app.post("/api/v1/auth/users", response_model=UserResponse)
-async def create_user(request: UserCreateRequest, current_user: User = Depends(require_admin)) -> UserResponse:
+async def create_user(
+    request: UserCreateRequest,
+    current_user: User = Depends(require_admin),
+    auth_manager: APIKeyManager = Depends(auth_manager_dependency),
+) -> UserResponse:
     """Create a new user (admin only)."""
-    auth_manager = get_auth_manager()
     user = await auth_manager.create_user(
         username=request.username,
         password=request.password,
@@ -1164,9 +1183,12 @@ async def get_current_user_info(current_user: User = Depends(get_current_user))
 
 
 @app.post("/api/v1/auth/apikeys", response_model=APIKeyCreateResponse)
-async def create_api_key(request: APIKeyCreateRequest, current_user: User = Depends(get_current_user)) -> APIKeyCreateResponse:
+async def create_api_key(
+    request: APIKeyCreateRequest,
+    current_user: User = Depends(get_current_user),
+    auth_manager: APIKeyManager = Depends(auth_manager_dependency),
+) -> APIKeyCreateResponse:
     """Create a new API key for the current user."""
-    auth_manager = get_auth_manager()
     api_key = await auth_manager.create_api_key(
         user_id=current_user.id,
         name=request.name,
@@ -1183,9 +1205,11 @@ async def create_api_key(request: APIKeyCreateRequest, current_user: User = Depe
 
 
 @app.get("/api/v1/auth/apikeys", response_model=List[APIKeyResponse])
-async def list_api_keys(current_user: User = Depends(get_current_user)) -> List[APIKeyResponse]:
+async def list_api_keys(
+    current_user: User = Depends(get_current_user),
+    auth_manager: APIKeyManager = Depends(auth_manager_dependency),
+) -> List[APIKeyResponse]:
     """List API keys for the current user."""
-    auth_manager = get_auth_manager()
     api_keys = await auth_manager.get_user_api_keys(current_user.id)
     return [
         APIKeyResponse(
@@ -1201,13 +1225,39 @@ async def list_api_keys(current_user: User = Depends(get_current_user)) -> List[
 
 
 @app.delete("/api/v1/auth/apikeys/{key_id}")
-async def revoke_api_key(key_id: str, current_user: User = Depends(get_current_user)) -> Dict[str, str]:
+async def revoke_api_key(
+    key_id: str,
+    current_user: User = Depends(get_current_user),
+    auth_manager: APIKeyManager = Depends(auth_manager_dependency),
+) -> Dict[str, str]:
     """Revoke an API key."""
-    auth_manager = get_auth_manager()
     auth_manager.revoke_api_key(key_id, current_user.id)
     return {"message": "API key revoked successfully"}
 
 
+def create_app(*, with_middleware: bool = True) -> FastAPI:
+    """
+    Build an app that serves the same routes and lifespan as ``app``.
+
+    The routes are shared, so dependency overrides set on ``app`` apply to
+    the new app as well. ``with_middleware=False`` skips CORS and request
+    logging, which tests that do not exercise them have no use for.
+    """
+    new_app = FastAPI(
+        title=app.title,
+        description=app.description,
+        version=app.version,
+        openapi_url=None,  # The shared routes already include the docs routes
+        docs_url=None,
+        redoc_url=None,
+        lifespan=lifespan,
+    )
+    new_app.router.routes.extend(app.router.routes)
+    if with_middleware:
+        install_middleware(new_app)
+    return new_app
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8002)  # nosec B104
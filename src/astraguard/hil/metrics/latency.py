@@ -1,21 +1,107 @@
 """High-resolution latency tracking for HIL validation."""
 
-import time
 import csv
 import logging
-import heapq
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from collections import defaultdict
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
+from dataclasses import dataclass
+from collections.abc import Sequence
 from pathlib import Path
+from time import time as _time
 
-logger = logging.getLogger(__name__)
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_NUMERIC_TYPES = (int, float)
+_ERR_SAT_ID = "Invalid sat_id: must be non-empty string, got {}"
+_ERR_NON_NEGATIVE = "Invalid {}: must be non-negative number, got {}"
+
+# Metric types are stored per row as an int8 code indexing _METRIC_TYPES
+_METRIC_TYPES = ("fault_detection", "agent_decision", "recovery_action")
+_FAULT_DETECTION, _AGENT_DECISION, _RECOVERY_ACTION = range(len(_METRIC_TYPES))
+_METRIC_CODES = {name: code for code, name in enumerate(_METRIC_TYPES)}
+# record_* duration argument name per metric code, used in validation errors
+_DURATION_ARGS = ("detection_delay_ms", "decision_time_ms", "action_time_ms")
+
+_INITIAL_CAPACITY = 1024
+# Below this many buckets a parallel kernel launch costs more than it saves
+_PARALLEL_MIN_BUCKETS = 8
+_CSV_FIELDS = ["timestamp", "metric_type", "satellite_id", "duration_ms", "scenario_time_s"]
+
+
+def _is_non_negative_number(value: Any) -> bool:
+    """Exact-type fast path for int/float, isinstance fallback for subclasses (e.g. np.float64)."""
+    cls = value.__class__
+    if cls is not float and cls is not int and not isinstance(value, _NUMERIC_TYPES):
+        return False
+    # `not < 0` rather than `>= 0` so NaN passes, as the per-method checks always allowed
+    return not value < 0
+
+
+def _validate_record(
+    sat_id: Any, scenario_time_s: Any, duration_ms: Any, duration_name: str
+) -> None:
+    """
+    Validate the arguments shared by every record_* method.
+
+    Error messages are only formatted on the failure path.
+
+    Raises:
+        ValueError: If sat_id is empty or either numeric argument is negative/non-numeric.
+    """
+    if (sat_id.__class__ is not str and not isinstance(sat_id, str)) or not sat_id.strip():
+        raise ValueError(_ERR_SAT_ID.format(sat_id))
+    if not _is_non_negative_number(scenario_time_s):
+        raise ValueError(_ERR_NON_NEGATIVE.format("scenario_time_s", scenario_time_s))
+    if not _is_non_negative_number(duration_ms):
+        raise ValueError(_ERR_NON_NEGATIVE.format(duration_name, duration_ms))
+
+
+if HAS_NUMBA:
+
+    def _bucket_percentiles_kernel(durations, starts, ends, out):  # pragma: no cover - JIT
+        """Fill out[b] with (p50, p95, p99) of durations[starts[b]:ends[b]], one bucket per thread."""
+        for b in prange(starts.size):
+            values = np.sort(durations[starts[b]:ends[b]])
+            count = values.size
+            out[b, 0] = values[count // 2]
+            out[b, 1] = values[int(count * 0.95)]
+            out[b, 2] = values[int(count * 0.99)]
+
+
+_bucket_percentiles_parallel = None
+
+
+def _get_parallel_kernel():
+    """
+    Compile the Numba percentile kernel on first use.
+
+    The explicit signature compiles once; cache=True persists the machine code
+    under __pycache__ (or $NUMBA_CACHE_DIR) so later processes skip the JIT.
+    This is deferred past import because loading the cache unpickles an
+    environment that imports this module by the name it was cached under,
+    which is a circular import while the module is still initializing.
+    """
+    global _bucket_percentiles_parallel
+    if _bucket_percentiles_parallel is None:
+        _bucket_percentiles_parallel = njit(
+            "void(f8[:], i8[:], i8[:], f8[:, :])", parallel=True, cache=True
+        )(_bucket_percentiles_kernel)
+    return _bucket_percentiles_parallel
+
+
+@dataclass(frozen=True)
 class LatencyMeasurement:
-    """Single latency measurement point."""
+    """Single latency measurement point (immutable, slotted)."""
+
+    # Explicit __slots__ rather than dataclass(slots=True) to keep 3.9 support
+    __slots__ = ("timestamp", "metric_type", "satellite_id", "duration_ms", "scenario_time_s")
 
     timestamp: float  # Unix timestamp
     metric_type: str  # fault_detection, agent_decision, recovery_action
@@ -24,17 +110,205 @@ class LatencyMeasurement:
     scenario_time_s: float  # Simulation time when measured
 
 
+class _MeasurementsView(Sequence):
+    """
+    List-like view over a LatencyCollector's columnar storage.
+
+    Rows are materialized as LatencyMeasurement objects only when accessed.
+    """
+
+    __slots__ = ("_collector",)
+
+    def __init__(self, collector: "LatencyCollector") -> None:
+        self._collector = collector
+
+    def __len__(self) -> int:
+        return self._collector._size
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[LatencyMeasurement, List[LatencyMeasurement]]:
+        collector = self._collector
+        if isinstance(index, slice):
+            return [collector._row(i) for i in range(*index.indices(collector._size))]
+        if index < 0:
+            index += collector._size
+        if not 0 <= index < collector._size:
+            raise IndexError("measurement index out of range")
+        return collector._row(index)
+
+    def __iter__(self) -> Iterator[LatencyMeasurement]:
+        collector = self._collector
+        for i in range(collector._size):
+            yield collector._row(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, _MeasurementsView)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def append(self, measurement: LatencyMeasurement) -> None:
+        """Store a pre-built measurement without validation or type counting."""
+        code = _METRIC_CODES.get(measurement.metric_type)
+        if code is None:
+            raise ValueError(f"Unknown metric_type: {measurement.metric_type}")
+        self._collector._append(
+            measurement.timestamp,
+            code,
+            measurement.satellite_id,
+            float(measurement.duration_ms),
+            float(measurement.scenario_time_s),
+        )
+
+    def clear(self) -> None:
+        """Drop all stored rows."""
+        self._collector._clear_rows()
+
+
 class LatencyCollector:
-    """Captures high-resolution timing data across swarm (10Hz cadence)."""
+    """
+    Captures high-resolution timing data across swarm (10Hz cadence).
+
+    Measurements are kept column-wise in NumPy arrays that double in size
+    when full; ``measurements`` exposes them as a read-mostly list view.
+    """
 
     def __init__(self) -> None:
         """Initialize collector with empty measurements."""
-        self.measurements: List[LatencyMeasurement] = []
-        self._start_time: float = time.time()
-        self._measurement_log: Dict[str, int] = defaultdict(int)
+        self._start_time: float = _time()
+        self._n_fault: int = 0
+        self._n_agent: int = 0
+        self._n_recovery: int = 0
+        self._size: int = 0
+        self._cap: int = _INITIAL_CAPACITY
+        self._timestamp = np.empty(self._cap, dtype=np.float64)
+        self._metric_code = np.empty(self._cap, dtype=np.int8)
+        self._sat_code = np.empty(self._cap, dtype=np.int32)
+        self._duration = np.empty(self._cap, dtype=np.float64)
+        self._scenario_time = np.empty(self._cap, dtype=np.float64)
+        # Each distinct satellite ID is stored once; rows hold its int code
+        self._sat_codes: Dict[str, int] = {}
+        self._sat_ids: List[str] = []
+        # get_stats/get_stats_by_satellite caches, keyed by the include_percentiles
+        # flag; record_*/reset set _dirty so the next get_stats* call recomputes
+        self._stats_cache: Dict[bool, Dict[str, Any]] = {}
+        self._stats_by_sat_cache: Dict[bool, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: bool = False
+
+    @property
+    def _measurement_log(self) -> Dict[str, int]:
+        """Per-metric-type record counts, omitting types never recorded."""
+        log: Dict[str, int] = {}
+        if self._n_fault:
+            log["fault_detection"] = self._n_fault
+        if self._n_agent:
+            log["agent_decision"] = self._n_agent
+        if self._n_recovery:
+            log["recovery_action"] = self._n_recovery
+        return log
+
+    @property
+    def measurements(self) -> _MeasurementsView:
+        """Recorded measurements in insertion order."""
+        return _MeasurementsView(self)
+
+    def _grow(self) -> None:
+        """Double column capacity (amortized O(1) appends)."""
+        new_cap = self._cap * 2
+        self._timestamp = np.resize(self._timestamp, new_cap)
+        self._metric_code = np.resize(self._metric_code, new_cap)
+        self._sat_code = np.resize(self._sat_code, new_cap)
+        self._duration = np.resize(self._duration, new_cap)
+        self._scenario_time = np.resize(self._scenario_time, new_cap)
+        self._cap = new_cap
+
+    def _append(
+        self,
+        timestamp: float,
+        metric_code: int,
+        sat_id: str,
+        duration_ms: float,
+        scenario_time_s: float,
+    ) -> None:
+        """Write one row into the columns; inputs are assumed valid."""
+        sat_code = self._sat_codes.get(sat_id)
+        if sat_code is None:
+            sat_code = self._sat_codes[sat_id] = len(self._sat_ids)
+            self._sat_ids.append(sat_id)
+
+        i = self._size
+        if i == self._cap:
+            self._grow()
+        self._timestamp[i] = timestamp
+        self._metric_code[i] = metric_code
+        self._sat_code[i] = sat_code
+        self._duration[i] = duration_ms
+        self._scenario_time[i] = scenario_time_s
+        self._size = i + 1
+        self._dirty = True
+
+    def _row(self, i: int) -> LatencyMeasurement:
+        """Materialize row ``i`` as a LatencyMeasurement."""
+        return LatencyMeasurement(
+            timestamp=float(self._timestamp[i]),
+            metric_type=_METRIC_TYPES[self._metric_code[i]],
+            satellite_id=self._sat_ids[self._sat_code[i]],
+            duration_ms=float(self._duration[i]),
+            scenario_time_s=float(self._scenario_time[i]),
+        )
+
+    def _clear_rows(self) -> None:
+        """Drop all rows, keeping the allocated columns for reuse."""
+        self._size = 0
+        self._sat_codes.clear()
+        self._sat_ids.clear()
+        self._dirty = True
+
+    def _buckets(
+        self, keys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Group durations by integer key.
+
+        Returns:
+            (bucket_keys, starts, ends, durations) where durations are ordered by
+            key (insertion order within a key), so durations[starts[b]:ends[b]] is bucket b.
+        """
+        durations = self._duration[: self._size]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        bucket_keys, starts = np.unique(sorted_keys, return_index=True)
+        ends = np.append(starts[1:], sorted_keys.size)
+        return bucket_keys, starts, ends, durations[order]
+
+    def _record(
+        self,
+        metric_code: int,
+        sat_id: str,
+        scenario_time_s: float,
+        duration_ms: float,
+        now_ts: Optional[float],
+    ) -> None:
+        """Validate and store one measurement; shared body of every record_* method."""
+        _validate_record(sat_id, scenario_time_s, duration_ms, _DURATION_ARGS[metric_code])
+        if now_ts is None:
+            now_ts = _time()
+        self._append(now_ts, metric_code, sat_id, float(duration_ms), float(scenario_time_s))
+        logger.debug(
+            "Recorded %s latency: %s, %sms", _METRIC_TYPES[metric_code], sat_id, duration_ms
+        )
 
     def record_fault_detection(
-        self, sat_id: str, scenario_time_s: float, detection_delay_ms: float
+        self,
+        sat_id: str,
+        scenario_time_s: float,
+        detection_delay_ms: float,
+        now_ts: Optional[float] = None,
     ) -> None:
         """
         Record the latency of a fault detection event.
@@ -47,32 +321,21 @@ class LatencyCollector:
             scenario_time_s (float): Simulation time (seconds) when detection occurred.
             detection_delay_ms (float): Time elapsed (milliseconds) from fault injection
                                         to detection. Must be non-negative.
+            now_ts (float, optional): Wall-clock timestamp to store; defaults to
+                                      time.time(). Lets bulk or replay callers skip the clock read.
 
         Raises:
             ValueError: If inputs are invalid (empty ID, negative metrics).
         """
-        if not isinstance(sat_id, str) or not sat_id.strip():
-            raise ValueError(f"Invalid sat_id: must be non-empty string, got {sat_id}")
-
-        if not isinstance(scenario_time_s, (int, float)) or scenario_time_s < 0:
-            raise ValueError(f"Invalid scenario_time_s: must be non-negative number, got {scenario_time_s}")
-
-        if not isinstance(detection_delay_ms, (int, float)) or detection_delay_ms < 0:
-            raise ValueError(f"Invalid detection_delay_ms: must be non-negative number, got {detection_delay_ms}")
-
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="fault_detection",
-            satellite_id=sat_id,
-            duration_ms=float(detection_delay_ms),
-            scenario_time_s=float(scenario_time_s),
-        )
-        self.measurements.append(measurement)
-        self._measurement_log["fault_detection"] += 1
-        logger.debug(f"Recorded fault detection latency: {sat_id}, {detection_delay_ms}ms")
+        self._record(_FAULT_DETECTION, sat_id, scenario_time_s, detection_delay_ms, now_ts)
+        self._n_fault += 1
 
     def record_agent_decision(
-        self, sat_id: str, scenario_time_s: float, decision_time_ms: float
+        self,
+        sat_id: str,
+        scenario_time_s: float,
+        decision_time_ms: float,
+        now_ts: Optional[float] = None,
     ) -> None:
         """
         Record agent decision latency.
@@ -81,29 +344,17 @@ class LatencyCollector:
             sat_id: Satellite identifier
             scenario_time_s: Simulation time of decision
             decision_time_ms: Time for agent to process and decide
+            now_ts: Timestamp to store instead of time.time()
         """
-        if not isinstance(sat_id, str) or not sat_id.strip():
-            raise ValueError(f"Invalid sat_id: must be non-empty string, got {sat_id}")
-        
-        if not isinstance(scenario_time_s, (int, float)) or scenario_time_s < 0:
-            raise ValueError(f"Invalid scenario_time_s: must be non-negative number, got {scenario_time_s}")
-        
-        if not isinstance(decision_time_ms, (int, float)) or decision_time_ms < 0:
-            raise ValueError(f"Invalid decision_time_ms: must be non-negative number, got {decision_time_ms}")
-
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="agent_decision",
-            satellite_id=sat_id,
-            duration_ms=float(decision_time_ms),
-            scenario_time_s=float(scenario_time_s),
-        )
-        self.measurements.append(measurement)
-        self._measurement_log["agent_decision"] += 1
-        logger.debug(f"Recorded agent decision latency: {sat_id}, {decision_time_ms}ms")
+        self._record(_AGENT_DECISION, sat_id, scenario_time_s, decision_time_ms, now_ts)
+        self._n_agent += 1
 
     def record_recovery_action(
-        self, sat_id: str, scenario_time_s: float, action_time_ms: float
+        self,
+        sat_id: str,
+        scenario_time_s: float,
+        action_time_ms: float,
+        now_ts: Optional[float] = None,
     ) -> None:
         """
         Record recovery action execution latency.
@@ -112,94 +363,134 @@ class LatencyCollector:
             sat_id: Satellite identifier
             scenario_time_s: Simulation time of action
             action_time_ms: Time to execute recovery action
+            now_ts: Timestamp to store instead of time.time()
         """
-        if not isinstance(sat_id, str) or not sat_id.strip():
-            raise ValueError(f"Invalid sat_id: must be non-empty string, got {sat_id}")
-        
-        if not isinstance(scenario_time_s, (int, float)) or scenario_time_s < 0:
-            raise ValueError(f"Invalid scenario_time_s: must be non-negative number, got {scenario_time_s}")
-        
-        if not isinstance(action_time_ms, (int, float)) or action_time_ms < 0:
-            raise ValueError(f"Invalid action_time_ms: must be non-negative number, got {action_time_ms}")
-
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="recovery_action",
-            satellite_id=sat_id,
-            duration_ms=float(action_time_ms),
-            scenario_time_s=float(scenario_time_s),
-        )
-        self.measurements.append(measurement)
-        self._measurement_log["recovery_action"] += 1
-        logger.debug(f"Recorded recovery action latency: {sat_id}, {action_time_ms}ms")
-
-    def get_stats(self) -> Dict[str, Any]:
+        self._record(_RECOVERY_ACTION, sat_id, scenario_time_s, action_time_ms, now_ts)
+        self._n_recovery += 1
+
+    def _drop_stale_stats(self) -> None:
+        """Discard cached stats if measurements changed since they were computed."""
+        if self._dirty:
+            self._stats_cache.clear()
+            self._stats_by_sat_cache.clear()
+            self._dirty = False
+
+    @staticmethod
+    def _bucket_aggregates(
+        durations: np.ndarray, starts: np.ndarray, ends: np.ndarray
+    ) -> Tuple[List[int], List[float], List[float], List[float]]:
+        """Count, mean, min and max of every bucket in one vectorized pass each."""
+        counts = ends - starts
+        means = np.add.reduceat(durations, starts) / counts
+        mins = np.minimum.reduceat(durations, starts)
+        maxs = np.maximum.reduceat(durations, starts)
+        return counts.tolist(), means.tolist(), mins.tolist(), maxs.tolist()
+
+    def _bucket_percentiles(
+        self, durations: np.ndarray, starts: np.ndarray, ends: np.ndarray
+    ) -> List[Dict[str, float]]:
+        """Percentiles of every bucket; parallel via Numba when there are enough buckets."""
+        if HAS_NUMBA and starts.size >= _PARALLEL_MIN_BUCKETS:
+            out = np.empty((starts.size, 3), dtype=np.float64)
+            _get_parallel_kernel()(
+                durations, starts.astype(np.int64), ends.astype(np.int64), out
+            )
+            return [
+                {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99} for p50, p95, p99 in out.tolist()
+            ]
+        return [
+            self._calculate_percentiles(durations[start:end])
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+
+    def get_stats(self, include_percentiles: bool = True) -> Dict[str, Any]:
         """
         Calculate aggregate latency statistics.
 
+        The result is cached until the next record_* or reset() call; callers
+        receive a copy, so mutating it does not affect later calls.
+
+        Args:
+            include_percentiles: When False, skip percentile selection and
+                return only count, mean, min and max.
+
         Returns:
-            Dict with per-metric-type statistics (count, mean, p50, p95, max)
+            Dict with per-metric-type statistics (count, mean, p50, p95, p99, max, min)
         """
-        if not self.measurements:
+        if not self._size:
             return {}
 
-        by_type = defaultdict(list)
-        for m in self.measurements:
-            by_type[m.metric_type].append(m.duration_ms)
+        self._drop_stale_stats()
+        cached = self._stats_cache.get(include_percentiles)
+        if cached is None:
+            cached = self._compute_stats(include_percentiles)
+            self._stats_cache[include_percentiles] = cached
+        return {metric: dict(entry) for metric, entry in cached.items()}
+
+    def _compute_stats(self, include_percentiles: bool) -> Dict[str, Dict[str, Any]]:
+        """Compute the per-metric-type statistics returned by get_stats."""
+        codes, starts, ends, durations = self._buckets(self._metric_code[: self._size])
+        counts, means, mins, maxs = self._bucket_aggregates(durations, starts, ends)
+        if include_percentiles:
+            percentiles = self._bucket_percentiles(durations, starts, ends)
 
         stats = {}
-        for metric_type, latencies in by_type.items():
-            if not latencies:
-                continue
-                
-            sorted_latencies = sorted(latencies)
-            count = len(sorted_latencies)
-
-            stats[metric_type] = {
-                "count": count,
-                "mean_ms": sum(latencies) / count,
-                "p50_ms": sorted_latencies[count // 2],
-                "p95_ms": sorted_latencies[int(count * 0.95)],
-                "p99_ms": sorted_latencies[int(count * 0.99)],
-                "max_ms": max(latencies),
-                "min_ms": min(latencies),
-            }
+        for b, code in enumerate(codes.tolist()):
+            entry: Dict[str, Any] = {"count": counts[b], "mean_ms": means[b]}
+            if include_percentiles:
+                entry.update(percentiles[b])
+            entry["max_ms"] = maxs[b]
+            entry["min_ms"] = mins[b]
+            stats[_METRIC_TYPES[code]] = entry
 
         logger.debug(f"Calculated statistics for {len(stats)} metric types")
         return stats
 
-    def get_stats_by_satellite(self) -> Dict[str, Dict[str, Any]]:
+    def get_stats_by_satellite(self, include_percentiles: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Calculate statistics per satellite.
 
+        The result is cached until the next record_* or reset() call; callers
+        receive a copy, so mutating it does not affect later calls.
+
+        Args:
+            include_percentiles: When False, skip p50/p95 and return only
+                count, mean and max.
+
         Returns:
             Dict mapping satellite ID to stats
         """
-        if not self.measurements:
+        if not self._size:
             return {}
 
-        by_satellite: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+        self._drop_stale_stats()
+        cached = self._stats_by_sat_cache.get(include_percentiles)
+        if cached is None:
+            cached = self._compute_stats_by_satellite(include_percentiles)
+            self._stats_by_sat_cache[include_percentiles] = cached
+        return {
+            sat_id: {metric: dict(entry) for metric, entry in sat_stats.items()}
+            for sat_id, sat_stats in cached.items()
+        }
 
-        for m in self.measurements:
-            by_satellite[m.satellite_id][m.metric_type].append(m.duration_ms)
+    def _compute_stats_by_satellite(self, include_percentiles: bool) -> Dict[str, Dict[str, Any]]:
+        """Compute the per-satellite statistics returned by get_stats_by_satellite."""
+        n_types = len(_METRIC_TYPES)
+        keys = self._sat_code[: self._size].astype(np.int64) * n_types + self._metric_code[: self._size]
+        bucket_keys, starts, ends, durations = self._buckets(keys)
+        counts, means, _, maxs = self._bucket_aggregates(durations, starts, ends)
+        if include_percentiles:
+            percentiles = self._bucket_percentiles(durations, starts, ends)
 
         stats: Dict[str, Dict[str, Any]] = {}
-        for sat_id, metrics in by_satellite.items():
-            stats[sat_id] = {}
-            for metric_type, latencies in metrics.items():
-                if not latencies:
-                    continue
-                    
-                sorted_latencies = sorted(latencies)
-                count = len(sorted_latencies)
-
-                stats[sat_id][metric_type] = {
-                    "count": count,
-                    "mean_ms": sum(latencies) / count,
-                    "p50_ms": sorted_latencies[count // 2],
-                    "p95_ms": sorted_latencies[int(count * 0.95)],
-                    "max_ms": max(latencies),
-                }
+        for b, key in enumerate(bucket_keys.tolist()):
+            sat_code, code = divmod(key, n_types)
+            entry: Dict[str, Any] = {"count": counts[b], "mean_ms": means[b]}
+            if include_percentiles:
+                entry["p50_ms"] = percentiles[b]["p50_ms"]
+                entry["p95_ms"] = percentiles[b]["p95_ms"]
+            entry["max_ms"] = maxs[b]
+            stats.setdefault(self._sat_ids[sat_code], {})[_METRIC_TYPES[code]] = entry
 
         logger.debug(f"Calculated statistics for {len(stats)} satellites")
         return stats
@@ -218,7 +509,7 @@ class LatencyCollector:
         if not isinstance(filename, str) or not filename.strip():
             raise ValueError(f"Invalid filename: must be non-empty string, got {filename}")
         
-        if not self.measurements:
+        if not self._size:
             raise ValueError("No measurements to export")
 
         filepath = Path(filename)
@@ -239,31 +530,32 @@ class LatencyCollector:
 
         try:
             with open(filepath, "w", newline="", encoding='utf-8') as f:
-                fieldnames = [
-                    "timestamp",
-                    "metric_type",
-                    "satellite_id",
-                    "duration_ms",
-                    "scenario_time_s",
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                # Write in batches for better performance
-                batch_size = 1000
-                for i in range(0, len(self.measurements), batch_size):
-                    batch = self.measurements[i:i + batch_size]
-                    for m in batch:
-                        writer.writerow(asdict(m))
+                writer = csv.writer(f)
+                writer.writerow(_CSV_FIELDS)
 
-            logger.info(f"Exported {len(self.measurements)} measurements to {filepath}")
+                # Write in batches straight from the columns for better performance
+                batch_size = 1000
+                sat_ids = self._sat_ids
+                for i in range(0, self._size, batch_size):
+                    end = min(i + batch_size, self._size)
+                    writer.writerows(
+                        zip(
+                            self._timestamp[i:end].tolist(),
+                            [_METRIC_TYPES[c] for c in self._metric_code[i:end].tolist()],
+                            [sat_ids[c] for c in self._sat_code[i:end].tolist()],
+                            self._duration[i:end].tolist(),
+                            self._scenario_time[i:end].tolist(),
+                        )
+                    )
+
+            logger.info(f"Exported {self._size} measurements to {filepath}")
             
         except OSError as e:
             logger.error(
                 f"Failed to write CSV file: {e}",
                 extra={
                     "filepath": str(filepath),
-                    "measurement_count": len(self.measurements),
+                    "measurement_count": self._size,
                     "error_type": "OSError",
                     "operation": "file_write"
                 },
@@ -283,57 +575,63 @@ class LatencyCollector:
             )
             raise
 
-    def get_summary(self) -> Dict[str, Any]:
+    def get_summary(self, include_percentiles: bool = True) -> Dict[str, Any]:
         """
         Get human-readable summary.
 
+        Args:
+            include_percentiles: Forwarded to get_stats/get_stats_by_satellite;
+                pass False for a cheaper overview without percentiles.
+
         Returns:
             Dict with high-level metrics summary
         """
-        if not self.measurements:
+        # Answer directly so an empty collector never reaches get_stats*
+        if not self._size:
             return {"total_measurements": 0, "metrics": {}}
 
         return {
-            "total_measurements": len(self.measurements),
-            "measurement_types": dict(self._measurement_log),
-            "stats": self.get_stats(),
-            "stats_by_satellite": self.get_stats_by_satellite(),
+            "total_measurements": self._size,
+            # The property already builds a fresh dict from the counters
+            "measurement_types": self._measurement_log,
+            "stats": self.get_stats(include_percentiles),
+            "stats_by_satellite": self.get_stats_by_satellite(include_percentiles),
         }
 
     def reset(self) -> None:
         """Clear all measurements."""
-        self.measurements.clear()
-        self._measurement_log.clear()
+        self._clear_rows()
+        self._n_fault = self._n_agent = self._n_recovery = 0
 
-    def _calculate_percentiles(self, latencies: List[float]) -> Dict[str, float]:
+    def _calculate_percentiles(
+        self, latencies: Union[List[float], np.ndarray]
+    ) -> Dict[str, float]:
         """
-        Calculate percentiles using heap-based selection for better performance.
+        Calculate percentiles in O(n) with a single np.partition (introselect).
+
+        Uses the nearest-rank indices count // 2, int(count * 0.95) and
+        int(count * 0.99) into the sorted values.
 
         Args:
-            latencies: List of latency values
+            latencies: Latency values (list or 1-D array)
 
         Returns:
             Dict with p50_ms, p95_ms, p99_ms
         """
-        if not latencies:
+        values = np.asarray(latencies, dtype=np.float64)
+        count = values.size
+        if not count:
             return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
 
-        count = len(latencies)
-
-        # Use heapq to find percentiles without full sort
-        def nth_smallest(n: int) -> float:
-            return heapq.nsmallest(n, latencies)[-1] if n <= count else latencies[-1]
-
-        p50_index = count // 2 + 1
-        p95_index = int(count * 0.95) + 1
-        p99_index = int(count * 0.99) + 1
+        kth = (count // 2, int(count * 0.95), int(count * 0.99))
+        selected = np.partition(values, kth)
 
         return {
-            "p50_ms": nth_smallest(p50_index),
-            "p95_ms": nth_smallest(p95_index),
-            "p99_ms": nth_smallest(p99_index),
+            "p50_ms": float(selected[kth[0]]),
+            "p95_ms": float(selected[kth[1]]),
+            "p99_ms": float(selected[kth[2]]),
         }
 
     def __len__(self) -> int:
         """Return number of measurements."""
-        return len(self.measurements)
+        return self._size
@@ -9,16 +9,276 @@ Classes:
 """
 
 import asyncio
+import itertools
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import mmap
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, cast
+from time import time as _time
+from typing import BinaryIO, List, Dict, Any, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    # NON_STR_KEYS/SERIALIZE_NUMPY keep parity with what json.dumps(default=str) accepted
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | _ORJSON_COMPACT
+
+_STORAGE_MODES = ("files", "jsonl")
+_JSONL_FILENAME = "results.jsonl"
+
+
+# Files written by save_scenario_result (<name>_<YYYYMMDD_HHMMSS>_<NNNNNN>.json) and
+# the orchestrator / older versions (<name>_<YYYYMMDD_HHMMSS>.json)
+_RESULT_FILE_RE = re.compile(r"^(?P<name>.+)_(?P<stamp>\d{8}_\d{6})(?:_\d{4,})?\.json$")
+
+_stamp_lock = threading.Lock()
+_stamp_second: int = -1
+_stamp_prefix: str = ""
+_stamp_counter: int = 0
+
+
+def _next_file_stamp(now: float) -> str:
+    """Return a unique ``YYYYMMDD_HHMMSS_NNNNNN`` stamp for a new result file.
+
+    The strftime prefix is formatted once per second and the counter keeps
+    names unique (and in save order) for saves within the same second,
+    across all ResultStorage instances in the process. Six digits keep
+    names fixed-width, and so sortable, up to a million saves per second.
+    """
+    global _stamp_second, _stamp_prefix, _stamp_counter
+    second = int(now)
+    with _stamp_lock:
+        if second != _stamp_second:
+            _stamp_second = second
+            _stamp_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+            _stamp_counter = 0
+        else:
+            _stamp_counter += 1
+        return f"{_stamp_prefix}_{_stamp_counter:06d}"
+
+
+def _index_key(filename: str) -> Optional[str]:
+    """Return the scenario name a result file belongs to (None if unrecognised)."""
+    match = _RESULT_FILE_RE.match(filename)
+    return match.group("name") if match else None
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize result data to UTF-8 JSON bytes (orjson when available).
+
+    Output is compact and on a single line (newlines inside string values
+    are escaped), as needed for the JSONL log; ``indent=True`` pretty-prints
+    with two-space indentation for human inspection.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data, default=str, option=_ORJSON_OPTIONS if indent else _ORJSON_COMPACT
+        )
+    return json.dumps(data, indent=2 if indent else None, default=str).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_JSON_WHITESPACE = b" \t\r\n"
+
+
+def _load_object(raw: Union[bytes, memoryview]) -> Dict[str, Any]:
+    """Parse a result/campaign document, rejecting non-objects before parsing.
+
+    Checking that the first and last non-whitespace bytes are ``{`` and ``}``
+    turns truncated or garbage files into an immediate JSONDecodeError
+    instead of a full parse attempt.
+    """
+    start, end = 0, len(raw)
+    while start < end and raw[start] in _JSON_WHITESPACE:
+        start += 1
+    while end > start and raw[end - 1] in _JSON_WHITESPACE:
+        end -= 1
+    if end - start < 2 or raw[start] != 0x7B or raw[end - 1] != 0x7D:
+        raise json.JSONDecodeError("Expecting a JSON object", "", 0)
+    return cast(Dict[str, Any], _loads(raw))
+
+
+_MMAP_MIN_SIZE = 64 * 1024
+
+
+def _read_object(filepath: Path) -> Dict[str, Any]:
+    """Read and parse a JSON object file.
+
+    Files of 64 KiB and more are memory-mapped and parsed by orjson straight
+    from the page cache, skipping the copy into an intermediate bytes object;
+    below that the mapping setup costs more than the copy it saves.
+    """
+    with open(filepath, "rb") as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return _load_object(view)
+                finally:
+                    view.release()
+        return _load_object(f.read())
+
+
+def _read_fields(filepath: Path, fields: Sequence[str]) -> Dict[str, Any]:
+    """Read only the requested top-level keys of a result file.
+
+    With ijson the file is streamed and parsing stops as soon as every
+    requested key has been seen, so large payloads that follow the metadata
+    (e.g. telemetry arrays) are never materialized.
+
+    Files that are not a JSON object raise JSONDecodeError, as with a full
+    read. When parsing stops early, the unread rest of the file is only
+    checked for its closing ``}``, which catches truncated files; damage in
+    the middle of the unread part goes undetected.
+    """
+    wanted = set(fields)
+    if not HAS_IJSON:
+        data = _read_object(filepath)
+        return {k: v for k, v in data.items() if k in wanted}
+
+    selected: Dict[str, Any] = {}
+    try:
+        with open(filepath, "rb") as f:
+            events = ijson.parse(f, use_float=True)
+            first = next(events, None)
+            if first is None or first[1] != "start_map":
+                raise json.JSONDecodeError("Expecting a JSON object", "", 0)
+            for key, value in ijson.kvitems(itertools.chain((first,), events), ""):
+                if key in wanted:
+                    selected[key] = value
+                    if len(selected) == len(wanted):
+                        if not _ends_with_brace(f):
+                            raise json.JSONDecodeError("Unterminated JSON object", "", 0)
+                        break
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return selected
+
+
+def _ends_with_brace(f: BinaryIO) -> bool:
+    """Return whether the last non-whitespace byte of an open file is ``}``."""
+    size = os.fstat(f.fileno()).st_size
+    f.seek(max(0, size - 64))
+    return f.read().rstrip(_JSON_WHITESPACE).endswith(b"}")
+
+
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+_IO_POOL_WORKERS = 8
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """Return the executor shared by all ResultStorage instances for file reads."""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(
+            max_workers=_IO_POOL_WORKERS, thread_name_prefix="result-io"
+        )
+    return _io_pool
+
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _write_payload(filepath: Path, payload: bytes, drop_cache: bool = False) -> None:
+    """Write a serialized result with one write() through a 64 KiB buffer.
+
+    With ``drop_cache`` (POSIX only), payloads larger than the buffer are
+    followed by POSIX_FADV_DONTNEED so write-once results do not evict hotter
+    data from the page cache. The kernel starts writeback and drops the
+    pages once clean; the hint is best-effort.
+    """
+    with open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+        if drop_cache and _HAS_FADVISE and len(payload) > _WRITE_BUFFER_SIZE:
+            f.flush()
+            try:
+                os.posix_fadvise(f.fileno(), 0, len(payload), os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=1024)
+def _read_campaign_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a campaign file, memoized on its path and stat signature.
+
+    Callers pass the file's current ``st_mtime_ns``/``st_size`` so a rewritten
+    file misses the cache. The returned dict is shared between calls and
+    must be treated as read-only.
+    """
+    return _read_object(Path(path_str))
+
+
+_Count = Union[int, float]
+
+
+def _campaign_count(campaign: Dict[str, Any], key: str) -> _Count:
+    """Return a numeric count from a campaign summary field (0 when missing).
+
+    Raises:
+        ValueError: If the field is present but not a number.
+    """
+    value = campaign.get(key, 0)
+    if not isinstance(value, (int, float)):
+        raise ValueError(f"invalid {key!r}: {value!r}")
+    return value
+
+
+def _load_campaign_counts(campaign_files: Sequence[Path]) -> List[Tuple[_Count, _Count]]:
+    """Load (total_scenarios, passed) per campaign, skipping unreadable or non-numeric files."""
+    counts: List[Tuple[_Count, _Count]] = []
+    for campaign_file in campaign_files:
+        try:
+            st = campaign_file.stat()
+            campaign = _read_campaign_cached(str(campaign_file), st.st_mtime_ns, st.st_size)
+            counts.append(
+                (_campaign_count(campaign, "total_scenarios"), _campaign_count(campaign, "passed"))
+            )
+        except (OSError, IOError, PermissionError) as e:
+            logger.warning(f"Failed to read campaign file {campaign_file.name}: {e}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Corrupted campaign file {campaign_file.name}: {e}")
+        except ValueError as e:
+            logger.warning(f"Malformed campaign file {campaign_file.name}: {e}")
+        except Exception as e:
+            # Log unexpected errors but continue processing other files (best-effort)
+            logger.error(
+                f"Unexpected error loading campaign {campaign_file.name}: {e}",
+                extra={"file": str(campaign_file)},
+                exc_info=True
+            )
+    return counts
+
 
 class ResultStorage:
     """Manages persistent storage and retrieval of test results.
@@ -31,15 +291,223 @@ class ResultStorage:
         results_dir (Path): Directory where result files are stored.
     """
 
-    def __init__(self, results_dir: str = "astraguard/hil/results") -> None:
+    def __init__(
+        self,
+        results_dir: str = "astraguard/hil/results",
+        mode: str = "files",
+        drop_page_cache: bool = False,
+    ) -> None:
         """
         Initialize result storage.
 
+        The directory is created on the first save, not here; read paths
+        treat a missing directory as empty.
+
         Args:
             results_dir (str): Directory for result files.
+            mode (str): ``"files"`` writes one JSON file per saved result;
+                ``"jsonl"`` appends one line per result to ``results.jsonl``
+                through a single open handle. Campaign summaries are read
+                from individual files in both modes.
+            drop_page_cache (bool): Advise the kernel to drop large result
+                files from the page cache after writing them (POSIX only).
+
+        Raises:
+            ValueError: If mode is not a supported storage mode.
         """
+        if mode not in _STORAGE_MODES:
+            raise ValueError(f"Invalid storage mode: {mode} (expected one of {_STORAGE_MODES})")
+
         self.results_dir: Path = Path(results_dir)
-        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.mode: str = mode
+        self.drop_page_cache: bool = drop_page_cache
+        self._dir_ready: bool = False
+        # JSONL mode: append handle opened on first save, and
+        # scenario name -> [(offset, length)] of its lines in file order
+        self._jsonl_path: Path = self.results_dir / _JSONL_FILENAME
+        self._jsonl_file: Optional[BinaryIO] = None
+        self._jsonl_lock = threading.Lock()
+        self._jsonl_index: Dict[str, List[Tuple[int, int]]] = {}
+        self._jsonl_indexed_upto: int = 0
+        # Inode the index refers to; another instance compacting the log swaps it
+        self._jsonl_ino: Optional[int] = None
+        # scenario name -> result files sorted by name (i.e. by timestamp);
+        # campaign summaries live under "campaign", unrecognised files under None
+        self._index: Dict[Optional[str], List[Path]] = {}
+        self._index_mtime_ns: Optional[int] = None
+
+    def _ensure_dir(self) -> None:
+        """Create the results directory before the first write."""
+        if not self._dir_ready:
+            self.results_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def close(self) -> None:
+        """Close the JSONL append handle, if one is open."""
+        with self._jsonl_lock:
+            if self._jsonl_file is not None:
+                self._jsonl_file.close()
+                self._jsonl_file = None
+
+    def _append_jsonl(self, lines: Sequence[Tuple[str, bytes]]) -> None:
+        """Append ``(scenario_name, line)`` records to the log in one write and index them."""
+        data = b"".join(line for _, line in lines)
+        with self._jsonl_lock:
+            if self._jsonl_file is not None and not self._jsonl_handle_current():
+                # Another instance compacted the log into a new file; follow it
+                self._jsonl_file.close()
+                self._jsonl_file = None
+            if self._jsonl_file is None:
+                self._jsonl_file = open(self._jsonl_path, "ab")
+                ino = os.fstat(self._jsonl_file.fileno()).st_ino
+                if ino != self._jsonl_ino:
+                    self._jsonl_index = {}
+                    self._jsonl_indexed_upto = 0
+                    self._jsonl_ino = ino
+            self._jsonl_file.write(data)
+            self._jsonl_file.flush()
+            end = self._jsonl_file.tell()
+            offset = end - len(data)
+            # Lines appended by another writer in between are picked up by the next scan
+            if offset == self._jsonl_indexed_upto:
+                for scenario_name, line in lines:
+                    self._jsonl_index.setdefault(scenario_name, []).append((offset, len(line)))
+                    offset += len(line)
+                self._jsonl_indexed_upto = end
+
+    def _jsonl_handle_current(self) -> bool:
+        """Whether the append handle still points at the log file. Caller holds _jsonl_lock."""
+        try:
+            return os.stat(self._jsonl_path).st_ino == os.fstat(self._jsonl_file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _refresh_jsonl_index(self) -> None:
+        """Index log lines past the last scanned offset. Caller holds _jsonl_lock."""
+        try:
+            st = self._jsonl_path.stat()
+            size, ino = st.st_size, st.st_ino
+        except FileNotFoundError:
+            size, ino = 0, None
+        if size < self._jsonl_indexed_upto or ino != self._jsonl_ino:
+            # Log was truncated or replaced; start over
+            self._jsonl_index = {}
+            self._jsonl_indexed_upto = 0
+            self._jsonl_ino = ino
+        if size == self._jsonl_indexed_upto:
+            return
+
+        offset = self._jsonl_indexed_upto
+        with open(self._jsonl_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line still being written
+                try:
+                    scenario_name = _load_object(line).get("scenario_name")
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    logger.warning(f"Corrupted line at offset {offset} in {self._jsonl_path.name}: {e}")
+                    scenario_name = None
+                if isinstance(scenario_name, str):
+                    self._jsonl_index.setdefault(scenario_name, []).append((offset, len(line)))
+                offset += len(line)
+        self._jsonl_indexed_upto = offset
+
+    def _compact_jsonl(self, cutoff_time: float) -> int:
+        """Rewrite the log without lines timestamped before ``cutoff_time``.
+
+        Lines whose timestamp cannot be parsed are kept. The append handle is
+        closed and the offset index reset, since every offset may move. Other
+        instances notice the new inode on their next append or read; lines
+        they append while the new file is being written are carried over.
+
+        Returns:
+            int: Number of log lines removed.
+        """
+        with self._jsonl_lock:
+            try:
+                f = open(self._jsonl_path, "rb")
+            except FileNotFoundError:
+                return 0
+            with f:
+                lines = f.readlines()
+                kept: List[bytes] = []
+                for line in lines:
+                    try:
+                        timestamp = _load_object(line).get("timestamp")
+                        expired = datetime.fromisoformat(timestamp).timestamp() < cutoff_time
+                    except (json.JSONDecodeError, UnicodeDecodeError, TypeError, ValueError):
+                        expired = False
+                    if not expired:
+                        kept.append(line)
+
+                removed = len(lines) - len(kept)
+                if not removed:
+                    return 0
+
+                if self._jsonl_file is not None:
+                    self._jsonl_file.close()
+                    self._jsonl_file = None
+                tmp_path = self._jsonl_path.with_name(self._jsonl_path.name + ".tmp")
+                with open(tmp_path, "wb") as out:
+                    out.writelines(kept)
+                    # Lines other writers appended since readlines()
+                    out.write(f.read())
+                os.replace(tmp_path, self._jsonl_path)
+            self._jsonl_index = {}
+            self._jsonl_indexed_upto = 0
+            self._jsonl_ino = None
+        return removed
+
+    def _read_jsonl_results(
+        self, scenario_name: str, limit: int, fields: Optional[Sequence[str]]
+    ) -> List[Dict[str, Any]]:
+        """Read the newest ``limit`` log lines of a scenario by offset (newest first)."""
+        with self._jsonl_lock:
+            self._refresh_jsonl_index()
+            entries = self._jsonl_index.get(scenario_name, [])[-limit:][::-1]
+        if not entries:
+            return []
+
+        wanted = set(fields) if fields is not None else None
+        results: List[Dict[str, Any]] = []
+        with open(self._jsonl_path, "rb") as f:
+            for offset, length in entries:
+                f.seek(offset)
+                data = cast(Dict[str, Any], _loads(f.read(length)))
+                if wanted is not None:
+                    data = {k: v for k, v in data.items() if k in wanted}
+                results.append(data)
+        return results
+
+    def _dir_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.results_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_index(self) -> Dict[Optional[str], List[Path]]:
+        """Return the file index, rescanning only if the directory changed.
+
+        A single stat of the directory replaces the glob + sort each query
+        used to do; files written by other processes (e.g. the orchestrator's
+        campaign summaries) bump the directory mtime and trigger a rescan.
+        """
+        mtime_ns = self._dir_mtime_ns()
+        if mtime_ns is None or mtime_ns != self._index_mtime_ns:
+            index: Dict[Optional[str], List[Path]] = {}
+            try:
+                with os.scandir(self.results_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            index.setdefault(_index_key(entry.name), []).append(Path(entry.path))
+            except FileNotFoundError:
+                pass
+            for paths in index.values():
+                paths.sort()
+            self._index = index
+            self._index_mtime_ns = mtime_ns
+        return self._index
 
     def _check_disk_space(self, required_mb: int = 10) -> bool:
         """Check if sufficient disk space is available.
@@ -66,7 +534,9 @@ class ResultStorage:
             logger.warning(f"Could not check disk space: {e}")
             return True  # Assume OK if check fails
 
-    def _validate_result_structure(self, result: Dict[str, Any], scenario_name: str) -> str:
+    def _validate_result_structure(
+        self, result: Dict[str, Any], scenario_name: str, indent: bool = False
+    ) -> bytes:
         """Validate result structure and serialize to JSON.
         
         Checks for common issues like unusual status values, invalid timestamp types,
@@ -76,9 +546,10 @@ class ResultStorage:
         Args:
             result: Result dictionary to validate
             scenario_name: Name of the scenario for context
+            indent: Pretty-print the JSON instead of compact single-line output
             
         Returns:
-            str: JSON-serialized result string (for reuse in write)
+            bytes: JSON-serialized result (for reuse in write)
             
         Raises:
             ValueError: If result contains non-serializable or circular data
@@ -97,56 +568,92 @@ class ResultStorage:
         # Serialization check using same settings as write path (default=str)
         # This validates against circular references while keeping behavior consistent
         try:
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result, indent=indent)
         except (TypeError, ValueError, RecursionError) as e:
             raise ValueError(f"Result contains non-serializable or circular data: {e}")
 
-    async def save_scenario_result(
-        self, scenario_name: str, result: Dict[str, Any]
-    ) -> str:
-        """
-        Persist result data for a single HIL scenario execution.
-
-        Saves the result dictionary as a JSON file, automatically appending
-        timestamp metadata (`scenario_name_{timestamp}.json`).
+    def _prepare_result(
+        self, scenario_name: str, result: Dict[str, Any], pretty: bool = False
+    ) -> Tuple[Path, bytes]:
+        """Validate a scenario result and build its target path and payload.
 
         Args:
-            scenario_name (str): Name of the test scenario (e.g., "power_loss_geo").
-            result (Dict[str, Any]): The execution result object to save.
+            scenario_name: Name of the test scenario.
+            result: The execution result object to save.
+            pretty: Indent the JSON file (ignored in JSONL mode).
 
         Returns:
-            str: The absolute path to the saved result file.
+            Tuple[Path, bytes]: Destination file and serialized JSON payload.
 
         Raises:
-            OSError: If filesystem writes fail.
             ValueError: If input data is invalid or non-serializable.
         """
         if not scenario_name or not isinstance(scenario_name, str):
             raise ValueError(f"Invalid scenario_name: {scenario_name}")
-        
+
         if not isinstance(result, dict):
             raise ValueError(f"Result must be a dictionary, got {type(result)}")
 
-        timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename: str = f"{scenario_name}_{timestamp}.json"
-        filepath: Path = self.results_dir / filename
+        now = _time()
 
         # Ensure result has metadata
         result_with_metadata: Dict[str, Any] = {
             "scenario_name": scenario_name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
             **result,
         }
 
-        # Validate and serialize result_with_metadata (reuse JSON string)
-        json_str = self._validate_result_structure(result_with_metadata, scenario_name)
+        if self.mode == "jsonl":
+            line = self._validate_result_structure(result_with_metadata, scenario_name)
+            return self._jsonl_path, line + b"\n"
+
+        filename: str = f"{scenario_name}_{_next_file_stamp(now)}.json"
+        filepath: Path = self.results_dir / filename
+
+        # Validate and serialize result_with_metadata (reuse JSON bytes)
+        return filepath, self._validate_result_structure(
+            result_with_metadata, scenario_name, indent=pretty
+        )
+
+    async def save_scenario_result(
+        self, scenario_name: str, result: Dict[str, Any], pretty: bool = False
+    ) -> str:
+        """
+        Persist result data for a single HIL scenario execution.
+
+        Saves the result dictionary as a JSON file, automatically appending
+        timestamp metadata (`scenario_name_{timestamp}_{counter}.json`, where the
+        counter keeps saves within the same second distinct). In ``"jsonl"``
+        mode the result is appended as one line to ``results.jsonl`` instead.
+
+        Args:
+            scenario_name (str): Name of the test scenario (e.g., "power_loss_geo").
+            result (Dict[str, Any]): The execution result object to save.
+            pretty (bool, optional): Write indented JSON for human inspection.
+                Defaults to compact output.
+
+        Returns:
+            str: The absolute path to the saved result file.
 
+        Raises:
+            OSError: If filesystem writes fail.
+            ValueError: If input data is invalid or non-serializable.
+        """
+        filepath, payload = self._prepare_result(scenario_name, result, pretty)
+
+        self._ensure_dir()
         if not self._check_disk_space():
             raise OSError("Insufficient disk space to save result")
 
         try:
             # Perform file write off the event loop to avoid blocking
-            await asyncio.to_thread(filepath.write_text, json_str)
+            if self.mode == "jsonl":
+                await asyncio.to_thread(self._append_jsonl, ((scenario_name, payload),))
+            else:
+                await asyncio.to_thread(_write_payload, filepath, payload, self.drop_page_cache)
+                # The new directory mtime cannot be told apart from another
+                # writer's, so the next query rescans rather than patching in
+                self._index_mtime_ns = None
             logger.info(f"Saved scenario result: {filepath}")
             return str(filepath)
         except OSError as e:
@@ -164,8 +671,67 @@ class ResultStorage:
             logger.error(f"Failed to serialize result data for {scenario_name}: {e}")
             raise
 
+    async def save_scenario_results_bulk(
+        self, items: Sequence[Tuple[str, Dict[str, Any]]], pretty: bool = False
+    ) -> List[str]:
+        """
+        Persist several scenario results with a single hop off the event loop.
+
+        Every item is validated and serialized before anything is written, so
+        an invalid result leaves the directory untouched. The writes then run
+        back-to-back in one worker thread instead of one thread per file.
+
+        Args:
+            items (Sequence[Tuple[str, Dict[str, Any]]]): ``(scenario_name, result)`` pairs.
+            pretty (bool, optional): Write indented JSON. Defaults to compact output.
+
+        Returns:
+            List[str]: Paths of the saved result files, in input order.
+
+        Raises:
+            OSError: If filesystem writes fail.
+            ValueError: If any input is invalid or non-serializable.
+        """
+        prepared: List[Tuple[Path, bytes]] = [
+            self._prepare_result(scenario_name, result, pretty) for scenario_name, result in items
+        ]
+        if not prepared:
+            return []
+
+        self._ensure_dir()
+        if not self._check_disk_space():
+            raise OSError("Insufficient disk space to save result")
+
+        def write_all() -> None:
+            if self.mode == "jsonl":
+                self._append_jsonl(
+                    [(name, payload) for (name, _), (_, payload) in zip(items, prepared)]
+                )
+                return
+            for filepath, payload in prepared:
+                _write_payload(filepath, payload, self.drop_page_cache)
+
+        try:
+            await asyncio.to_thread(write_all)
+        except OSError as e:
+            self._index_mtime_ns = None
+            logger.error(
+                f"Failed to write bulk results: {e}",
+                extra={
+                    "count": len(prepared),
+                    "error_type": type(e).__name__,
+                    "operation": "bulk_write"
+                }
+            )
+            raise
+
+        if self.mode != "jsonl":
+            self._index_mtime_ns = None
+        logger.info(f"Saved {len(prepared)} scenario results")
+        return [str(filepath) for filepath, _ in prepared]
+
     async def get_scenario_results(
-        self, scenario_name: str, limit: int = 10
+        self, scenario_name: str, limit: int = 10, fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve recent results for a specific scenario.
@@ -173,6 +739,9 @@ class ResultStorage:
         Args:
             scenario_name (str): Name of scenario.
             limit (int, optional): Maximum results to return. Defaults to 10.
+            fields (Sequence[str], optional): Only return these top-level keys
+                (e.g. ``("timestamp", "success")``). Files are streamed and
+                parsing stops once the keys are found. Defaults to all keys.
 
         Returns:
             List[Dict[str, Any]]: List of result dicts (newest first).
@@ -189,15 +758,22 @@ class ResultStorage:
             logger.warning(f"Invalid limit: {limit}")
             return []
 
-        results: List[Dict[str, Any]] = []
-        pattern: str = f"{scenario_name}_*.json"
-        result_files: List[Path] = sorted(self.results_dir.glob(pattern), reverse=True)[:limit]
+        if self.mode == "jsonl":
+            try:
+                return await asyncio.to_thread(
+                    self._read_jsonl_results, scenario_name, limit, fields
+                )
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Failed to read results log {self._jsonl_path.name}: {e}")
+                return []
+
+        result_files: List[Path] = self._ensure_index().get(scenario_name, [])[-limit:][::-1]
 
-        async def load_result(result_file: Path):
+        async def load_result(result_file: Path) -> Optional[Dict[str, Any]]:
             try:
-                text = await asyncio.to_thread(result_file.read_text)
-                result_data = cast(Dict[str, Any], json.loads(text))
-                results.append(result_data)
+                if fields is not None:
+                    return await asyncio.to_thread(_read_fields, result_file, fields)
+                return await asyncio.to_thread(_read_object, result_file)
             except (OSError, IOError, PermissionError) as e:
                 logger.warning(f"Failed to read result file {result_file.name}: {e}")
             except (json.JSONDecodeError, UnicodeDecodeError) as e:
@@ -208,10 +784,11 @@ class ResultStorage:
                     extra={"file": str(result_file), "scenario": scenario_name},
                     exc_info=True,
                 )
+            return None
 
-        # Load files concurrently off the event loop
-        await asyncio.gather(*(load_result(f) for f in result_files))
-        return results
+        # Load files concurrently off the event loop; gather keeps newest-first order
+        results = await asyncio.gather(*(load_result(f) for f in result_files))
+        return [r for r in results if r is not None]
 
     async def get_recent_campaigns(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Retrieve recent campaign summaries asynchronously.
@@ -230,15 +807,13 @@ class ResultStorage:
             logger.warning(f"Invalid limit: {limit}")
             return []
 
-        campaigns: List[Dict[str, Any]] = []
-        campaign_files: List[Path] = sorted(
-            self.results_dir.glob("campaign_*.json"), reverse=True
-        )[:limit]
+        campaign_files: List[Path] = self._ensure_index().get("campaign", [])[-limit:][::-1]
+        loop = asyncio.get_running_loop()
+        pool = _get_io_pool()
 
-        async def load_campaign(campaign_file):
+        async def load_campaign(campaign_file: Path) -> Optional[Dict[str, Any]]:
             try:
-                campaign_data = cast(Dict[str, Any], json.loads(campaign_file.read_text()))
-                campaigns.append(campaign_data)
+                return await loop.run_in_executor(pool, _read_object, campaign_file)
             except (OSError, IOError, PermissionError) as e:
                 logger.warning(f"Failed to read campaign file {campaign_file.name}: {e}")
             except (json.JSONDecodeError, UnicodeDecodeError) as e:
@@ -250,7 +825,9 @@ class ResultStorage:
                     extra={"file": str(campaign_file)},
                     exc_info=True
                 )
+            return None
 
+        # Reads and decoding overlap on the shared I/O pool
         campaigns = await asyncio.gather(*[load_campaign(f) for f in campaign_files])
         return [c for c in campaigns if c is not None]
 
@@ -276,7 +853,7 @@ class ResultStorage:
             return None
 
         try:
-            return cast(Dict[str, Any], json.loads(campaign_file.read_text()))
+            return _read_object(campaign_file)
         except (OSError, IOError, PermissionError) as e:
             logger.error(
                 f"Failed to read campaign {campaign_id}: {e}",
@@ -303,17 +880,27 @@ class ResultStorage:
             Dict[str, Any]: Dict with statistics including total_campaigns,
                 total_scenarios, total_passed, and avg_pass_rate.
         """
-        campaigns: List[Dict[str, Any]] = await self.get_recent_campaigns(limit=999)
-        if not campaigns:
+        campaign_files: List[Path] = self._ensure_index().get("campaign", [])
+        loop = asyncio.get_running_loop()
+        # stat() and cache-miss parses stay off the event loop
+        counts: List[Tuple[_Count, _Count]] = await loop.run_in_executor(
+            _get_io_pool(), _load_campaign_counts, campaign_files
+        )
+
+        if not counts:
             return {
                 "total_campaigns": 0,
                 "total_scenarios": 0,
                 "avg_pass_rate": 0.0,
             }
 
-        total_campaigns: int = len(campaigns)
-        total_scenarios: int = sum(c.get("total_scenarios", 0) for c in campaigns)
-        total_passed: int = sum(c.get("passed", 0) for c in campaigns)
+        total_campaigns: int = len(counts)
+        # One (total_scenarios, passed) row per campaign, reduced in a single pass;
+        # int64 keeps integer totals exact, float64 only when a campaign has floats
+        has_floats = any(isinstance(v, float) for row in counts for v in row)
+        totals = np.array(counts, dtype=np.float64 if has_floats else np.int64).sum(axis=0)
+        total_scenarios: _Count = totals[0].item()
+        total_passed: _Count = totals[1].item()
         avg_pass_rate: float = total_passed / total_scenarios if total_scenarios > 0 else 0.0
 
         return {
@@ -326,11 +913,15 @@ class ResultStorage:
     async def clear_results(self, older_than_days: int = 30) -> int:
         """Remove old result files asynchronously.
 
+        Result and campaign files are deleted by modification time. The
+        ``results.jsonl`` log is compacted in place, dropping lines whose
+        ``timestamp`` is older than the cutoff.
+
         Args:
             older_than_days (int, optional): Delete files older than this many days. Defaults to 30.
 
         Returns:
-            int: Number of files deleted.
+            int: Number of files deleted plus JSONL log lines removed.
 
         Raises:
             OSError: If there is an issue accessing or deleting files.
@@ -344,29 +935,51 @@ class ResultStorage:
         cutoff_time: float = time() - (older_than_days * 86400)
         deleted_count: int = 0
 
-        for result_file in self.results_dir.glob("*.json"):
-            try:
-                if result_file.stat().st_mtime < cutoff_time:
-                    result_file.unlink()
-                    deleted_count += 1
-            except PermissionError as e:
-                logger.warning(
-                    f"Permission denied deleting file {result_file.name}: {e}",
-                    extra={"file": str(result_file), "operation": "delete"}
-                )
-            except FileNotFoundError:
-                # File already deleted, ignore
-                pass
-            except OSError as e:
-                logger.error(
-                    f"OS error deleting file {result_file.name}: {e}",
-                    extra={"file": str(result_file), "error_code": e.errno}
-                )
-            except Exception as e:
-                logger.critical(
-                    f"Critical unexpected error deleting file {result_file.name}: {e}",
-                    exc_info=True
-                )
+        try:
+            entries = os.scandir(self.results_dir)
+        except FileNotFoundError:
+            return 0
+
+        # DirEntry carries the name/type from the directory read, so only the
+        # mtime needs a stat (none at all on Windows, where it is cached too)
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                except PermissionError as e:
+                    logger.warning(
+                        f"Permission denied deleting file {entry.name}: {e}",
+                        extra={"file": entry.path, "operation": "delete"}
+                    )
+                except FileNotFoundError:
+                    # File already deleted, ignore
+                    pass
+                except OSError as e:
+                    logger.error(
+                        f"OS error deleting file {entry.name}: {e}",
+                        extra={"file": entry.path, "error_code": e.errno}
+                    )
+                except Exception as e:
+                    logger.critical(
+                        f"Critical unexpected error deleting file {entry.name}: {e}",
+                        exc_info=True
+                    )
+
+        try:
+            deleted_count += await asyncio.to_thread(self._compact_jsonl, cutoff_time)
+        except OSError as e:
+            logger.error(
+                f"OS error compacting {self._jsonl_path.name}: {e}",
+                extra={"file": str(self._jsonl_path), "error_code": e.errno}
+            )
+
+        if deleted_count:
+            self._index_mtime_ns = None
+            _read_campaign_cached.cache_clear()
 
         logger.info(f"Cleanup completed: deleted {deleted_count} files older than {older_than_days} days")
         return deleted_count
@@ -1,6 +1,7 @@
 """Production HIL test orchestration + parallel execution."""
 
 import asyncio
+import heapq
 import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -218,9 +219,8 @@ class ScenarioOrchestrator:
             List of campaign summary dicts (newest first)
         """
         campaigns = []
-        campaign_files = sorted(
-            self.results_dir.glob("campaign_*.json"), reverse=True
-        )[:limit]
+        # Only the newest `limit` names are needed: O(N log k) instead of a full sort
+        campaign_files = heapq.nlargest(limit, self.results_dir.glob("campaign_*.json"))
 
         for campaign_file in campaign_files:
             try:
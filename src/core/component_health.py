@@ -9,7 +9,7 @@ import logging
 from enum import Enum
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from threading import Lock, RLock
 
 logger = logging.getLogger(__name__)
@@ -121,6 +121,32 @@ class SystemHealthMonitor:
             self._update_system_status()
             logger.debug(f"Component {component} marked healthy")
     
+    def mark_all_healthy(self, components: Iterable[str]):
+        """
+        Mark several components as healthy under a single lock acquisition.
+        
+        Args:
+            components: Component names (unknown names are registered)
+        """
+        with self._component_lock:
+            now = datetime.now()
+            for component in components:
+                health = self._components.get(component)
+                if health is None:
+                    self._components[component] = ComponentHealth(
+                        name=component,
+                        status=HealthStatus.HEALTHY,
+                        last_updated=now,
+                        metadata={},
+                    )
+                    continue
+                health.status = HealthStatus.HEALTHY
+                health.last_updated = now
+                health.fallback_active = False
+            
+            self._update_system_status()
+            logger.debug("Components marked healthy")
+    
     def mark_degraded(self, component: str, error_msg: Optional[str] = None,
                       fallback_active: bool = True, metadata: Optional[Dict] = None):
         """
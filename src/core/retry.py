@@ -111,6 +111,10 @@ class Retry:
         def sync_wrapper(*args, **kwargs) -> Any:
             return self._execute_with_retry_sync(func, args, kwargs)
         
+        # Expose the policy so callers (and tests) can inspect or tune it
+        async_wrapper.retry = self  # type: ignore[attr-defined]
+        sync_wrapper.retry = self  # type: ignore[attr-defined]
+
         # Return appropriate wrapper
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
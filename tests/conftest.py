@@ -13,6 +13,13 @@ try:
 except ImportError:
     pytest_plugins = ()
 
+# uvloop is optional and has no Windows build
+try:
+    import uvloop
+    HAS_UVLOOP = sys.platform != "win32"
+except ImportError:
+    HAS_UVLOOP = False
+
 # Ensure project modules are importable
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
@@ -24,7 +31,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 @pytest.fixture(scope="function")
 def event_loop():
     """Create event loop for async tests (function scope for isolation)"""
-    import asyncio
     policy = asyncio.get_event_loop_policy()
     loop = policy.new_event_loop()
     policy.set_event_loop(loop)
@@ -312,7 +318,10 @@ def _cleanup_logging_handlers():
 # ============================================================================
 
 def pytest_configure(config):
-    """Register custom marks."""
+    """Register custom marks and select the event loop for async tests."""
+    # uvloop when installed, else asyncio's default loop
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
@@ -3,9 +3,13 @@
 import pytest
 import tempfile
 import os
+from dataclasses import FrozenInstanceError, asdict
 from unittest.mock import patch
 from src.astraguard.hil.metrics.latency import LatencyCollector, LatencyMeasurement
 
+# latency.py binds time.time at import, so patch its module-level alias
+TIME_TARGET = "src.astraguard.hil.metrics.latency._time"
+
 
 class TestLatencyMeasurement:
     """Test LatencyMeasurement dataclass."""
@@ -26,6 +30,20 @@ class TestLatencyMeasurement:
         assert measurement.duration_ms == 150.5
         assert measurement.scenario_time_s == 100.0
 
+    def test_latency_measurement_is_frozen_and_slotted(self):
+        """Test measurements are immutable and carry no per-instance __dict__."""
+        measurement = LatencyMeasurement(
+            timestamp=1234567890.0,
+            metric_type="fault_detection",
+            satellite_id="SAT1",
+            duration_ms=150.5,
+            scenario_time_s=100.0
+        )
+
+        assert not hasattr(measurement, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            measurement.duration_ms = 1.0
+
     def test_latency_measurement_asdict(self):
         """Test asdict conversion for CSV export."""
         measurement = LatencyMeasurement(
@@ -36,7 +54,7 @@ class TestLatencyMeasurement:
             scenario_time_s=150.0
         )
 
-        data = measurement.__dict__
+        data = asdict(measurement)
         expected = {
             "timestamp": 1234567890.0,
             "metric_type": "agent_decision",
@@ -61,7 +79,7 @@ class TestLatencyCollector:
         """Test recording fault detection latency."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.5)
 
         assert len(collector.measurements) == 1
@@ -77,7 +95,7 @@ class TestLatencyCollector:
         """Test recording agent decision latency."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567891.0):
+        with patch(TIME_TARGET, return_value=1234567891.0):
             collector.record_agent_decision("SAT2", 200.0, 75.0)
 
         assert len(collector.measurements) == 1
@@ -93,7 +111,7 @@ class TestLatencyCollector:
         """Test recording recovery action latency."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567892.0):
+        with patch(TIME_TARGET, return_value=1234567892.0):
             collector.record_recovery_action("SAT3", 300.0, 250.0)
 
         assert len(collector.measurements) == 1
@@ -105,11 +123,22 @@ class TestLatencyCollector:
         assert measurement.timestamp == 1234567892.0
         assert collector._measurement_log["recovery_action"] == 1
 
+    def test_record_with_explicit_timestamp(self):
+        """Test now_ts is stored as-is and the clock is not read."""
+        collector = LatencyCollector()
+
+        with patch(TIME_TARGET, side_effect=AssertionError("clock should not be read")):
+            collector.record_fault_detection("SAT1", 100.0, 150.0, now_ts=42.0)
+            collector.record_agent_decision("SAT1", 100.0, 75.0, now_ts=43.0)
+            collector.record_recovery_action("SAT1", 100.0, 250.0, now_ts=44.0)
+
+        assert [m.timestamp for m in collector.measurements] == [42.0, 43.0, 44.0]
+
     def test_multiple_recordings(self):
         """Test recording multiple measurements."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
+        with patch(TIME_TARGET, side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
             collector.record_agent_decision("SAT1", 200.0, 75.0)
             collector.record_recovery_action("SAT2", 300.0, 250.0)
@@ -119,6 +148,15 @@ class TestLatencyCollector:
         assert collector._measurement_log["agent_decision"] == 1
         assert collector._measurement_log["recovery_action"] == 1
 
+    def test_satellite_ids_are_interned(self):
+        """Test repeated satellite IDs share a single string object."""
+        collector = LatencyCollector()
+
+        for i in range(2):
+            collector.record_fault_detection("".join(["SAT", str(1)]), float(i), 10.0)
+
+        assert collector.measurements[0].satellite_id is collector.measurements[1].satellite_id
+
     def test_get_stats_empty(self):
         """Test get_stats with no measurements."""
         collector = LatencyCollector()
@@ -129,7 +167,7 @@ class TestLatencyCollector:
         """Test get_stats with single measurement per type."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
 
         stats = collector.get_stats()
@@ -147,7 +185,7 @@ class TestLatencyCollector:
         """Test get_stats with multiple measurements."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
+        with patch(TIME_TARGET, side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
             collector.record_fault_detection("SAT1", 100.0, 100.0)
             collector.record_fault_detection("SAT1", 200.0, 200.0)
             collector.record_fault_detection("SAT1", 300.0, 300.0)
@@ -162,6 +200,56 @@ class TestLatencyCollector:
         assert fd_stats["max_ms"] == 300.0
         assert fd_stats["min_ms"] == 100.0
 
+    def test_get_stats_cached_until_next_record(self):
+        """Test stats are reused between reads and recomputed after a new record."""
+        collector = LatencyCollector()
+        collector.record_fault_detection("SAT1", 100.0, 100.0)
+
+        first = collector.get_stats()
+        with patch.object(collector, "_compute_stats") as compute:
+            assert collector.get_stats() == first
+        compute.assert_not_called()
+        with patch.object(collector, "_compute_stats_by_satellite") as compute:
+            collector.get_stats_by_satellite()
+            collector.get_stats_by_satellite()
+        assert compute.call_count == 1
+
+        collector.record_fault_detection("SAT1", 200.0, 300.0)
+        refreshed = collector.get_stats()
+        assert refreshed["fault_detection"]["count"] == 2
+        assert collector.get_stats_by_satellite()["SAT1"]["fault_detection"]["count"] == 2
+
+    def test_get_stats_returns_copies_of_cache(self):
+        """Test that mutating returned stats does not leak into the cache."""
+        collector = LatencyCollector()
+        collector.record_fault_detection("SAT1", 100.0, 100.0)
+
+        stats = collector.get_stats()
+        stats["fault_detection"]["count"] = 99
+        stats.pop("fault_detection")
+        by_sat = collector.get_stats_by_satellite()
+        by_sat["SAT1"]["fault_detection"]["count"] = 99
+
+        assert collector.get_stats()["fault_detection"]["count"] == 1
+        assert collector.get_stats_by_satellite()["SAT1"]["fault_detection"]["count"] == 1
+
+    def test_get_stats_without_percentiles(self):
+        """Test include_percentiles=False returns only count/mean/min/max."""
+        collector = LatencyCollector()
+
+        with patch(TIME_TARGET, return_value=1234567890.0):
+            for latency in [100.0, 200.0, 300.0]:
+                collector.record_fault_detection("SAT1", 100.0, latency)
+
+        fd_stats = collector.get_stats(include_percentiles=False)["fault_detection"]
+        assert fd_stats == {"count": 3, "mean_ms": 200.0, "max_ms": 300.0, "min_ms": 100.0}
+
+        sat_stats = collector.get_stats_by_satellite(include_percentiles=False)
+        assert sat_stats["SAT1"]["fault_detection"] == {"count": 3, "mean_ms": 200.0, "max_ms": 300.0}
+
+        # The full result is still computed and cached independently
+        assert collector.get_stats()["fault_detection"]["p50_ms"] == 200.0
+
     def test_get_stats_by_satellite_empty(self):
         """Test get_stats_by_satellite with no measurements."""
         collector = LatencyCollector()
@@ -172,7 +260,7 @@ class TestLatencyCollector:
         """Test get_stats_by_satellite with one satellite."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=[1234567890.0, 1234567891.0]):
+        with patch(TIME_TARGET, side_effect=[1234567890.0, 1234567891.0]):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
             collector.record_agent_decision("SAT1", 200.0, 75.0)
 
@@ -193,7 +281,7 @@ class TestLatencyCollector:
         """Test get_stats_by_satellite with multiple satellites."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
+        with patch(TIME_TARGET, side_effect=[1234567890.0, 1234567891.0, 1234567892.0]):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
             collector.record_fault_detection("SAT2", 200.0, 200.0)
             collector.record_agent_decision("SAT1", 300.0, 75.0)
@@ -215,7 +303,7 @@ class TestLatencyCollector:
         """Test CSV export functionality."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.5)
 
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as tmp:
@@ -248,7 +336,7 @@ class TestLatencyCollector:
         """Test get_summary with measurements."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=[1234567890.0, 1234567891.0]):
+        with patch(TIME_TARGET, side_effect=[1234567890.0, 1234567891.0]):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
             collector.record_agent_decision("SAT2", 200.0, 75.0)
 
@@ -263,7 +351,7 @@ class TestLatencyCollector:
         """Test reset functionality."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
 
         assert len(collector.measurements) == 1
@@ -278,7 +366,7 @@ class TestLatencyCollector:
         collector = LatencyCollector()
         assert len(collector) == 0
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
 
         assert len(collector) == 1
@@ -290,7 +378,7 @@ class TestLatencyCollector:
         """Test stats_by_satellite with single measurement per satellite."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
 
         stats = collector.get_stats_by_satellite()
@@ -323,6 +411,34 @@ class TestLatencyCollector:
         assert sat1_fd["max_ms"] == 0.0
 
 
+    def test_measurements_view_grows_past_initial_capacity(self):
+        """Test columnar storage keeps rows intact across capacity doubling."""
+        collector = LatencyCollector()
+
+        with patch(TIME_TARGET, return_value=1234567890.0):
+            for i in range(3000):
+                collector.record_agent_decision(f"SAT{i % 2 + 1}", float(i), float(i))
+
+        assert len(collector.measurements) == 3000
+        assert collector.measurements[-1].duration_ms == 2999.0
+        assert collector.measurements[2999].satellite_id == "SAT2"
+        assert [m.duration_ms for m in collector.measurements[10:13]] == [10.0, 11.0, 12.0]
+
+    def test_measurements_view_append_rejects_unknown_metric_type(self):
+        """Test appending a measurement with an unknown metric type raises ValueError."""
+        collector = LatencyCollector()
+        measurement = LatencyMeasurement(
+            timestamp=1234567890.0,
+            metric_type="unknown",
+            satellite_id="SAT1",
+            duration_ms=1.0,
+            scenario_time_s=1.0
+        )
+
+        with pytest.raises(ValueError, match="Unknown metric_type"):
+            collector.measurements.append(measurement)
+        assert len(collector) == 0
+
 class TestLatencyValidation:
     """Test input validation for LatencyCollector."""
 
@@ -375,6 +491,14 @@ class TestLatencyValidation:
         with pytest.raises(ValueError, match="Invalid detection_delay_ms"):
             collector.record_fault_detection("SAT1", 100.0, "invalid")
 
+    def test_record_accepts_nan_durations(self):
+        """Test that NaN passes the non-negative check, as it always has."""
+        collector = LatencyCollector()
+
+        collector.record_fault_detection("SAT1", float("nan"), float("nan"))
+
+        assert len(collector) == 1
+
     def test_record_agent_decision_empty_sat_id(self):
         """Test record_agent_decision raises ValueError for empty sat_id."""
         collector = LatencyCollector()
@@ -417,11 +541,20 @@ class TestLatencyValidation:
         with pytest.raises(ValueError, match="Invalid action_time_ms: must be non-negative number"):
             collector.record_recovery_action("SAT1", 100.0, -250.0)
 
+    def test_record_accepts_numeric_subclasses(self):
+        """Test numpy scalars (float subclasses) pass validation, as the scenario executor sends them."""
+        import numpy as np
+        collector = LatencyCollector()
+
+        collector.record_fault_detection("SAT1", np.float64(100.0), np.float64(150.0))
+
+        assert collector.measurements[0].duration_ms == 150.0
+
     def test_export_csv_empty_filename(self):
         """Test export_csv raises ValueError for empty filename."""
         collector = LatencyCollector()
         
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
         
         with pytest.raises(ValueError, match="Invalid filename: must be non-empty string"):
@@ -431,7 +564,7 @@ class TestLatencyValidation:
         """Test export_csv raises ValueError for whitespace-only filename."""
         collector = LatencyCollector()
         
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 150.0)
         
         with pytest.raises(ValueError, match="Invalid filename: must be non-empty string"):
@@ -452,7 +585,7 @@ class TestLatencyBoundaryConditions:
         """Test handling of zero latency values."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 0.0, 0.0)
 
         assert len(collector.measurements) == 1
@@ -468,7 +601,7 @@ class TestLatencyBoundaryConditions:
         """Test handling of very small latency values (microseconds)."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 0.0001)
             collector.record_agent_decision("SAT1", 200.0, 0.0005)
 
@@ -481,7 +614,7 @@ class TestLatencyBoundaryConditions:
         """Test handling of very large latency values."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             collector.record_fault_detection("SAT1", 100.0, 999999.0)
             collector.record_agent_decision("SAT1", 200.0, 888888.0)
 
@@ -495,7 +628,7 @@ class TestLatencyBoundaryConditions:
         collector = LatencyCollector()
 
         # Add 150 measurements
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             for i in range(150):
                 collector.record_fault_detection(f"SAT{i % 3 + 1}", float(i), float(i * 10))
 
@@ -507,12 +640,30 @@ class TestLatencyBoundaryConditions:
         sat_stats = collector.get_stats_by_satellite()
         assert len(sat_stats) == 3  # SAT1, SAT2, SAT3
 
+    def test_stats_by_satellite_many_buckets(self):
+        """Test per-bucket percentiles stay exact when enough buckets exist for the parallel path."""
+        collector = LatencyCollector()
+        expected = {}
+
+        with patch(TIME_TARGET, return_value=1234567890.0):
+            for sat in range(10):
+                latencies = [float((i * 7 + sat) % 50) for i in range(40)]
+                expected[f"SAT{sat}"] = collector._calculate_percentiles(latencies)
+                for latency in latencies:
+                    collector.record_fault_detection(f"SAT{sat}", 1.0, latency)
+
+        sat_stats = collector.get_stats_by_satellite()
+        assert len(sat_stats) == 10
+        for sat_id, percentiles in expected.items():
+            assert sat_stats[sat_id]["fault_detection"]["p50_ms"] == percentiles["p50_ms"]
+            assert sat_stats[sat_id]["fault_detection"]["p95_ms"] == percentiles["p95_ms"]
+
     def test_percentile_calculation_accuracy(self):
         """Test accurate percentile calculation with known values."""
         collector = LatencyCollector()
 
         # Add 100 measurements with values 0-99
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             for i in range(100):
                 collector.record_fault_detection("SAT1", 0.0, float(i))
 
@@ -531,7 +682,7 @@ class TestLatencyBoundaryConditions:
         """Test statistics with mixed metric types."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=list(range(1234567890, 1234567890 + 9))):
+        with patch(TIME_TARGET, side_effect=list(range(1234567890, 1234567890 + 9))):
             collector.record_fault_detection("SAT1", 100.0, 100.0)
             collector.record_fault_detection("SAT1", 200.0, 200.0)
             collector.record_fault_detection("SAT1", 300.0, 300.0)
@@ -568,6 +719,15 @@ class TestLatencyBoundaryConditions:
         assert percentiles["p50_ms"] == 60.0  # 50th percentile
         assert percentiles["p95_ms"] == 100.0  # 95th percentile
 
+    def test_calculate_percentiles_unsorted_input(self):
+        """Test selection-based percentiles match sorted-index lookup on shuffled input."""
+        collector = LatencyCollector()
+
+        latencies = [float((i * 37) % 100) for i in range(100)]
+        percentiles = collector._calculate_percentiles(latencies)
+
+        assert percentiles == {"p50_ms": 50.0, "p95_ms": 95.0, "p99_ms": 99.0}
+
     def test_calculate_percentiles_empty_list(self):
         """Test _calculate_percentiles with empty list."""
         collector = LatencyCollector()
@@ -591,7 +751,7 @@ class TestLatencyBoundaryConditions:
         collector = LatencyCollector()
 
         # Add 2500 measurements to test batch writing (batch_size=1000)
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             for i in range(2500):
                 collector.record_fault_detection(f"SAT{i % 3 + 1}", float(i), float(i * 10))
 
@@ -616,7 +776,7 @@ class TestLatencyBoundaryConditions:
         """Test that integer inputs are properly converted to float."""
         collector = LatencyCollector()
 
-        with patch('time.time', return_value=1234567890.0):
+        with patch(TIME_TARGET, return_value=1234567890.0):
             # Pass integers instead of floats
             collector.record_fault_detection("SAT1", 100, 150)
 
@@ -630,7 +790,7 @@ class TestLatencyBoundaryConditions:
         """Test comprehensive multi-satellite scenario."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=list(range(1234567890, 1234567890 + 12))):
+        with patch(TIME_TARGET, side_effect=list(range(1234567890, 1234567890 + 12))):
             # SAT1: 4 measurements
             collector.record_fault_detection("SAT1", 100.0, 100.0)
             collector.record_agent_decision("SAT1", 200.0, 50.0)
@@ -674,7 +834,7 @@ class TestLatencyBoundaryConditions:
         """Test get_summary with comprehensive data."""
         collector = LatencyCollector()
 
-        with patch('time.time', side_effect=list(range(1234567890, 1234567890 + 6))):
+        with patch(TIME_TARGET, side_effect=list(range(1234567890, 1234567890 + 6))):
             collector.record_fault_detection("SAT1", 100.0, 100.0)
             collector.record_fault_detection("SAT2", 200.0, 200.0)
             collector.record_agent_decision("SAT1", 300.0, 50.0)
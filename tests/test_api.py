@@ -2,28 +2,30 @@
 Tests for REST API endpoints.
 """
 
+import asyncio
+import json
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
-from api.service import app, initialize_components
+from api.service import app, auth_manager_dependency, create_app
+
+
+_COMPONENTS = ("anomaly_detector", "memory_store", "state_machine", "circuit_breaker")
 
 
 @pytest.fixture(autouse=True)
-async def setup_components():
-    """Initialize components before all tests."""
-    await initialize_components()
-    # Reset memory store to ensure test isolation
-    from api.service import memory_store
+def reset_state(client):
+    """Reset the mutable service state the module-scoped client shares."""
+    from api.service import memory_store, anomaly_history, active_faults
     if memory_store:
         memory_store.memory = []
-    
+    anomaly_history.clear()
+    active_faults.clear()
+
     # Reset component health to ensure all start as HEALTHY
     from core.component_health import get_health_monitor
-    health_monitor = get_health_monitor()
-    
-    # Mark all components as healthy for tests
-    for component_name in ["anomaly_detector", "memory_store", "state_machine", "circuit_breaker"]:
-        health_monitor.mark_healthy(component_name)
+    get_health_monitor().mark_all_healthy(_COMPONENTS)
 
 
 @pytest.fixture(autouse=True)
@@ -35,43 +37,126 @@ def mock_psutil(monkeypatch):
 
 
 from api.auth import get_api_key, APIKey
+from api.models import AnomalyResponse
 from core.auth import get_current_user, User, UserRole
-from unittest.mock import MagicMock
-from core.auth import get_auth_manager
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import HTTPException
 from api.service import get_current_username
 
-@pytest.fixture
+# Fixed payloads are serialized once and posted as raw bytes.
+_JSON_HEADERS = {"content-type": "application/json"}
+_NOMINAL_TELEMETRY = json.dumps({"voltage": 8.0, "temperature": 25.0, "gyro": 0.01}).encode()
+_OVERSIZE_BATCH = b'{"telemetry": [' + b", ".join([_NOMINAL_TELEMETRY] * 1001) + b"]}"  # Exceeds limit
+
+# Tests that fill or inspect the service's module-level history, memory and
+# fault state share one xdist worker under ``--dist loadgroup``.
+_STATEFUL = pytest.mark.xdist_group("api_state")
+
+
+# Returned by the auth overrides on every request; built once.
+_FAKE_API_KEY = APIKey(
+    key="test-key",
+    name="Test Key",
+    created_at=datetime(2024, 1, 1),
+    permissions={"read", "write", "admin"},
+    rate_limit=10000
+)
+_FAKE_USER = User(
+    id="test-user-id",
+    username="test-operator",
+    email="operator@test.local",
+    role=UserRole.OPERATOR,
+    created_at=datetime(2024, 1, 1),
+    is_active=True
+)
+_FAKE_ADMIN = User(
+    id="test-admin-id",
+    username="test-admin",
+    email="admin@test.local",
+    role=UserRole.ADMIN,
+    created_at=datetime(2024, 1, 1),
+    is_active=True
+)
+
+
+# Same routes and lifespan without the CORS and request logging layers;
+# only ``TestCORS`` goes through the full ``app``.
+_BARE_APP = create_app(with_middleware=False)
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create test client with auth override."""
+    """Create one test client with auth override for the whole module.
+
+    Entering the client runs the app lifespan, which initializes the
+    components once; ``reset_state`` clears what tests mutate in between.
+    Overrides live on ``app``, whose routes ``_BARE_APP`` shares.
+    """
     # Mock valid API key
     async def mock_get_api_key():
-        return APIKey(
-            key="test-key",
-            name="Test Key",
-            created_at=datetime.now(),
-            permissions={"read", "write", "admin"},
-            rate_limit=10000
-        )
-    
+        return _FAKE_API_KEY
+
     # Mock current user with OPERATOR role (has SUBMIT_TELEMETRY permission)
     def mock_get_current_user():
-        return User(
-            id="test-user-id",
-            username="test-operator",
-            email="operator@test.local",
-            role=UserRole.OPERATOR,
-            created_at=datetime.now(),
-            is_active=True
-        )
-    
+        return _FAKE_USER
+
     app.dependency_overrides[get_api_key] = mock_get_api_key
     app.dependency_overrides[get_current_user] = mock_get_current_user
-    with TestClient(app) as c:
+    app.dependency_overrides[auth_manager_dependency] = lambda: _AUTH_MANAGER
+    # Build the schema up front; FastAPI keeps it on ``app.openapi_schema``.
+    app.openapi()
+    with TestClient(_BARE_APP) as c:
         yield c
     # Clean up
     app.dependency_overrides = {}
 
 
+@pytest.fixture
+async def async_client(client):
+    """In-process async client for tests that issue requests concurrently.
+
+    Depends on ``client`` so the lifespan has already initialized the
+    components and the auth overrides are in place.
+    """
+    transport = httpx.ASGITransport(app=_BARE_APP)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+def _anomaly_record(score):
+    """History entry as ``submit_telemetry`` would record it."""
+    return AnomalyResponse(
+        is_anomaly=True,
+        anomaly_score=score,
+        anomaly_type="power_fault",
+        severity_score=score,
+        severity_level="HIGH",
+        mission_phase="NOMINAL_OPS",
+        recommended_action="ALERT_OPERATORS",
+        escalation_level="ALERT",
+        is_allowed=True,
+        allowed_actions=[],
+        should_escalate_to_safe_mode=False,
+        confidence=0.9,
+        reasoning="test anomaly",
+        recurrence_count=0,
+        timestamp=datetime(2024, 1, 1)
+    )
+
+
+@pytest.fixture
+def seeded_anomalies(client):
+    """Anomalies of rising severity written straight into the history.
+
+    Function-scoped because ``reset_state`` clears the history before
+    every test; seeding directly still skips the detector.
+    """
+    from api.service import anomaly_history
+    records = [_anomaly_record(score) for score in (0.3, 0.6, 0.9)]
+    anomaly_history.extend(records)
+    return records
+
+
 class TestHealthEndpoints:
     """Test health check endpoints."""
 
@@ -149,13 +234,8 @@ class TestTelemetryEndpoints:
 
     def test_telemetry_optional_fields(self, client):
         """Test telemetry with only required fields."""
-        telemetry = {
-            "voltage": 8.0,
-            "temperature": 25.0,
-            "gyro": 0.01
-            # current and wheel_speed are optional
-        }
-        response = client.post("/api/v1/telemetry", json=telemetry)
+        # current and wheel_speed are optional
+        response = client.post("/api/v1/telemetry", content=_NOMINAL_TELEMETRY, headers=_JSON_HEADERS)
         assert response.status_code == 200
 
 
@@ -186,13 +266,7 @@ class TestBatchEndpoints:
 
     def test_batch_size_limit(self, client):
         """Test batch size limit (max 1000)."""
-        batch = {
-            "telemetry": [
-                {"voltage": 8.0, "temperature": 25.0, "gyro": 0.01}
-                for _ in range(1001)  # Exceeds limit
-            ]
-        }
-        response = client.post("/api/v1/telemetry/batch", json=batch)
+        response = client.post("/api/v1/telemetry/batch", content=_OVERSIZE_BATCH, headers=_JSON_HEADERS)
         assert response.status_code == 422
 
 
@@ -280,27 +354,23 @@ class TestHistoryEndpoints:
         assert "anomalies" in data
         assert isinstance(data["anomalies"], list)
 
-    def test_history_with_limit(self, client):
+    @_STATEFUL
+    def test_history_with_limit(self, client, seeded_anomalies):
         """Test history with limit parameter."""
-        response = client.get("/api/v1/history/anomalies?limit=5")
+        response = client.get("/api/v1/history/anomalies?limit=2")
         assert response.status_code == 200
         data = response.json()
-        assert len(data["anomalies"]) <= 5
+        # The most recent entries are kept
+        assert [a["severity_score"] for a in data["anomalies"]] == [0.6, 0.9]
 
-    def test_history_with_severity_filter(self, client):
+    @_STATEFUL
+    def test_history_with_severity_filter(self, client, seeded_anomalies):
         """Test history with severity filter."""
-        # First submit an anomaly
-        telemetry = {
-            "voltage": 6.5,
-            "temperature": 50.0,
-            "gyro": 0.2
-        }
-        client.post("/api/v1/telemetry", json=telemetry)
-
         # Query with severity filter
         response = client.get("/api/v1/history/anomalies?severity_min=0.5")
         assert response.status_code == 200
         data = response.json()
+        assert data["count"] == 2
         # All returned anomalies should meet severity threshold
         for anomaly in data["anomalies"]:
             assert anomaly["severity_score"] >= 0.5
@@ -309,14 +379,14 @@ class TestHistoryEndpoints:
 class TestIntegrationFlow:
     """Test complete integration flow."""
 
-    def test_full_anomaly_detection_flow(self, client):
+    async def test_full_anomaly_detection_flow(self, async_client):
         """Test complete flow: submit telemetry -> detect anomaly -> check history."""
-        # 1. Check initial status
-        status_response = client.get("/api/v1/status")
+        # 1-2. Check initial status and current phase
+        status_response, phase_response = await asyncio.gather(
+            async_client.get("/api/v1/status"),
+            async_client.get("/api/v1/phase"),
+        )
         assert status_response.status_code == 200
-
-        # 2. Get current phase
-        phase_response = client.get("/api/v1/phase")
         assert phase_response.status_code == 200
         initial_phase = phase_response.json()["phase"]
 
@@ -328,30 +398,37 @@ class TestIntegrationFlow:
             "current": 2.0,
             "wheel_speed": 4000
         }
-        telemetry_response = client.post("/api/v1/telemetry", json=telemetry)
+        telemetry_response = await async_client.post("/api/v1/telemetry", json=telemetry)
         assert telemetry_response.status_code == 200
         detection = telemetry_response.json()
         assert detection["is_anomaly"] is True
 
-        # 4. Check anomaly history
-        history_response = client.get("/api/v1/history/anomalies?limit=10")
+        # 4-5. Check anomaly history and memory stats
+        history_response, memory_response = await asyncio.gather(
+            async_client.get("/api/v1/history/anomalies?limit=10"),
+            async_client.get("/api/v1/memory/stats"),
+        )
         assert history_response.status_code == 200
         history = history_response.json()
         assert history["count"] > 0
 
-        # 5. Check memory stats
-        memory_response = client.get("/api/v1/memory/stats")
         assert memory_response.status_code == 200
         memory = memory_response.json()
         assert memory["total_events"] > 0
 
 
+@pytest.fixture
+def cors_client(client):
+    """Client for the full middleware stack; components come from ``client``."""
+    return TestClient(app)
+
+
 class TestCORS:
     """Test CORS configuration."""
 
-    def test_cors_headers(self, client):
+    def test_cors_headers(self, cors_client):
         """Test CORS headers are present."""
-        response = client.options("/api/v1/telemetry")
+        response = cors_client.options("/api/v1/telemetry")
         # CORS middleware should handle OPTIONS requests
         assert response.status_code in [200, 405]
 
@@ -374,9 +451,11 @@ class TestOpenAPIDocumentation:
         assert "paths" in schema
 
 
+@_STATEFUL
 class TestMemoryBounds:
     """Test bounded history to prevent memory exhaustion."""
 
+    @pytest.mark.slow
     def test_history_bounded_to_max_size(self, client):
         """Test that anomaly history is bounded and doesn't grow indefinitely."""
         from api.service import anomaly_history, MAX_ANOMALY_HISTORY_SIZE
@@ -384,15 +463,15 @@ class TestMemoryBounds:
         # Clear history
         anomaly_history.clear()
 
-        # Submit anomalies up to the limit
+        telemetry = {
+            "voltage": 6.0,  # Anomalous
+            "temperature": 50.0,
+            "gyro": 0.3
+        }
+
+        # Submit anomalies up to the limit in one batch request
         initial_count = min(100, MAX_ANOMALY_HISTORY_SIZE)
-        for i in range(initial_count):
-            telemetry = {
-                "voltage": 6.0,  # Anomalous
-                "temperature": 50.0,
-                "gyro": 0.3
-            }
-            client.post("/api/v1/telemetry", json=telemetry)
+        client.post("/api/v1/telemetry/batch", json={"telemetry": [telemetry] * initial_count})
 
         # Verify history size
         assert len(anomaly_history) == initial_count
@@ -400,13 +479,7 @@ class TestMemoryBounds:
         # Submit more anomalies beyond the limit (if limit allows)
         if MAX_ANOMALY_HISTORY_SIZE < 200:
             overflow_count = 50
-            for i in range(overflow_count):
-                telemetry = {
-                    "voltage": 6.0,
-                    "temperature": 50.0,
-                    "gyro": 0.3
-                }
-                client.post("/api/v1/telemetry", json=telemetry)
+            client.post("/api/v1/telemetry/batch", json={"telemetry": [telemetry] * overflow_count})
 
             # Verify size is capped at max
             assert len(anomaly_history) == MAX_ANOMALY_HISTORY_SIZE
@@ -418,35 +491,77 @@ class TestMemoryBounds:
         # Clear and get initial state
         anomaly_history.clear()
 
-        # Add a few anomalies
-        for i in range(5):
-            telemetry = {
-                "voltage": 6.0 + i * 0.1,  # Slightly different values
-                "temperature": 50.0,
-                "gyro": 0.3
-            }
-            client.post("/api/v1/telemetry", json=telemetry)
+        # Add a few anomalies directly; detection is not under test here
+        scores = [0.6 + i * 0.05 for i in range(5)]  # Slightly different values
+        for score in scores:
+            anomaly_history.append(_anomaly_record(score))
 
-        # Get the first anomaly's voltage for verification
-        if len(anomaly_history) > 0:
-            first_anomaly_voltage = list(anomaly_history)[0].anomaly_score
+        # History should be in insertion order (FIFO)
+        history_response = client.get("/api/v1/history/anomalies?limit=10")
+        assert history_response.status_code == 200
+        data = history_response.json()
+        assert data["count"] == 5
+        assert [a["anomaly_score"] for a in data["anomalies"]] == scores
+
+
+def _auth_manager_stub():
+    """Auth manager double with realistic defaults for every endpoint under test.
+
+    The methods the endpoints await are ``AsyncMock``s.
+    """
+    manager = MagicMock()
+    manager.authenticate_user.return_value = "fake_token"
+    manager.create_user = AsyncMock()
+    manager.create_api_key = AsyncMock()
+    manager.get_user_api_keys = AsyncMock()
+
+    new_user = MagicMock()
+    new_user.id = "new_user_id"
+    new_user.username = "newuser"
+    new_user.role.value = "operator"
+    new_user.email = "new@example.com"
+    new_user.created_at = datetime.now()
+    new_user.is_active = True
+    manager.create_user.return_value = new_user
+
+    new_key = MagicMock()
+    new_key.id = "key_id"
+    new_key.name = "Test Key"
+    new_key.key = "generated_key"
+    new_key.permissions = ["read", "write"]
+    new_key.created_at = datetime.now()
+    new_key.expires_at = None
+    manager.create_api_key.return_value = new_key
+
+    listed_key = MagicMock(
+        id="key1",
+        permissions=["read"],
+        created_at=datetime.now(),
+        expires_at=None,
+        last_used=None
+    )
+    listed_key.name = "Key 1"  # ``name`` is reserved in the MagicMock constructor
+    manager.get_user_api_keys.return_value = [listed_key]
+    return manager
+
+
+# Built once and injected through the client's dependency overrides;
+# ``auth_manager`` clears per-test side effects and recorded calls.
+_AUTH_MANAGER = _auth_manager_stub()
 
-            # History should be in insertion order (FIFO)
-            history_response = client.get("/api/v1/history/anomalies?limit=10")
-            assert history_response.status_code == 200
-            data = history_response.json()
-            assert data["count"] >= 5
+
+@pytest.fixture
+def auth_manager():
+    """Shared auth manager double with the default behaviour restored."""
+    _AUTH_MANAGER.reset_mock(side_effect=True)
+    return _AUTH_MANAGER
 
 
 class TestAuthEndpoints:
     """Test authentication endpoints."""
 
-    def test_login_success(self, client, monkeypatch):
+    def test_login_success(self, client, auth_manager):
         """Test successful user login."""
-        mock_auth_manager = MagicMock()
-        mock_auth_manager.authenticate_user.return_value = "fake_token"
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
-
         login_data = {"username": "testuser", "password": "testpass"}
         response = client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 200
@@ -454,29 +569,20 @@ class TestAuthEndpoints:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
-    def test_login_failure(self, client, monkeypatch):
+    def test_login_failure(self, client, auth_manager):
         """Test login failure."""
-        mock_auth_manager = MagicMock()
-        mock_auth_manager.authenticate_user.side_effect = Exception("Invalid credentials")
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
+        auth_manager.authenticate_user.side_effect = HTTPException(
+            status_code=401, detail="Invalid credentials"
+        )
 
         login_data = {"username": "testuser", "password": "wrongpass"}
         response = client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 401
 
-    def test_create_user_admin_only(self, client, monkeypatch):
+    def test_create_user_admin_only(self, client, auth_manager, monkeypatch):
         """Test creating a user (admin only)."""
-        mock_auth_manager = MagicMock()
-        mock_user = MagicMock()
-        mock_user.id = "new_user_id"
-        mock_user.username = "newuser"
-        mock_user.role.value = "operator"
-        mock_user.email = "new@example.com"
-        mock_user.created_at = datetime.now()
-        mock_user.is_active = True
-        mock_auth_manager.create_user.return_value = mock_user
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
-
+        # Sign in as an admin so require_admin's permission check passes
+        monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: _FAKE_ADMIN)
         user_data = {
             "username": "newuser",
             "password": "securepass123",
@@ -497,19 +603,8 @@ class TestAuthEndpoints:
         assert data["username"] == "test-operator"
         assert data["role"] == "operator"
 
-    def test_create_api_key(self, client, monkeypatch):
+    def test_create_api_key(self, client, auth_manager):
         """Test creating an API key."""
-        mock_auth_manager = MagicMock()
-        mock_api_key = MagicMock()
-        mock_api_key.id = "key_id"
-        mock_api_key.name = "Test Key"
-        mock_api_key.key = "generated_key"
-        mock_api_key.permissions = ["read", "write"]
-        mock_api_key.created_at = datetime.now()
-        mock_api_key.expires_at = None
-        mock_auth_manager.create_api_key.return_value = mock_api_key
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
-
         key_data = {"name": "Test Key", "permissions": ["read", "write"]}
         response = client.post("/api/v1/auth/apikeys", json=key_data)
         assert response.status_code == 200
@@ -517,33 +612,16 @@ class TestAuthEndpoints:
         assert data["name"] == "Test Key"
         assert "key" in data
 
-    def test_list_api_keys(self, client, monkeypatch):
+    def test_list_api_keys(self, client, auth_manager):
         """Test listing API keys."""
-        mock_auth_manager = MagicMock()
-        mock_keys = [
-            MagicMock(
-                id="key1",
-                name="Key 1",
-                permissions=["read"],
-                created_at=datetime.now(),
-                expires_at=None,
-                last_used=None
-            )
-        ]
-        mock_auth_manager.get_user_api_keys.return_value = mock_keys
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
-
         response = client.get("/api/v1/auth/apikeys")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
         assert len(data) >= 0
 
-    def test_revoke_api_key(self, client, monkeypatch):
+    def test_revoke_api_key(self, client, auth_manager):
         """Test revoking an API key."""
-        mock_auth_manager = MagicMock()
-        monkeypatch.setattr("core.auth.get_auth_manager", lambda: mock_auth_manager)
-
         response = client.delete("/api/v1/auth/apikeys/key_id")
         assert response.status_code == 200
         data = response.json()
@@ -581,12 +659,7 @@ class TestLatestTelemetryEndpoint:
     def test_get_latest_telemetry_with_data(self, client):
         """Test getting latest telemetry after submitting data."""
         # First submit some telemetry
-        telemetry = {
-            "voltage": 8.0,
-            "temperature": 25.0,
-            "gyro": 0.01
-        }
-        client.post("/api/v1/telemetry", json=telemetry)
+        client.post("/api/v1/telemetry", content=_NOMINAL_TELEMETRY, headers=_JSON_HEADERS)
 
         # Then get latest
         response = client.get("/api/v1/telemetry/latest")
@@ -596,6 +669,7 @@ class TestLatestTelemetryEndpoint:
         assert "data" in data
 
 
+@_STATEFUL
 class TestChaosInjection:
     """Test chaos injection functionality."""
 
@@ -605,12 +679,7 @@ class TestChaosInjection:
         active_faults["network_latency"] = time.time() + 60  # Active for 60 seconds
 
         # This would normally cause a delay, but in test we can't easily verify sleep
-        telemetry = {
-            "voltage": 8.0,
-            "temperature": 25.0,
-            "gyro": 0.01
-        }
-        response = client.post("/api/v1/telemetry", json=telemetry)
+        response = client.post("/api/v1/telemetry", content=_NOMINAL_TELEMETRY, headers=_JSON_HEADERS)
         # Should still work, just slower
         assert response.status_code == 200
 
@@ -619,12 +688,7 @@ class TestChaosInjection:
         from api.service import active_faults
         active_faults["model_loader"] = time.time() + 60
 
-        telemetry = {
-            "voltage": 8.0,
-            "temperature": 25.0,
-            "gyro": 0.01
-        }
-        response = client.post("/api/v1/telemetry", json=telemetry)
+        response = client.post("/api/v1/telemetry", content=_NOMINAL_TELEMETRY, headers=_JSON_HEADERS)
         assert response.status_code == 503
         assert "Chaos Injection" in response.json()["detail"]
 
@@ -647,20 +711,20 @@ class TestHelperFunctions:
         # Now it should be active
         assert check_chaos_injection("test_fault")
 
-    def test_cleanup_expired_faults(self, client):
+    async def test_cleanup_expired_faults(self, client, monkeypatch):
         """Test cleanup of expired faults."""
         from api.service import cleanup_expired_faults, active_faults, inject_chaos_fault
 
         # Inject a short-lived fault
-        inject_chaos_fault("short_fault", 1)
+        monkeypatch.setattr("api.service._now", lambda: 1000.0)
+        await inject_chaos_fault("short_fault", 1)
         assert "short_fault" in active_faults
 
-        # Wait for expiration
-        import time
-        time.sleep(1.1)
+        # Move the clock past expiration
+        monkeypatch.setattr("api.service._now", lambda: 1002.0)
 
         # Cleanup
-        cleanup_expired_faults()
+        await cleanup_expired_faults()
         assert "short_fault" not in active_faults
 
     def test_create_response(self, client):
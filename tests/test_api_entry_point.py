@@ -13,6 +13,7 @@ Note: This tests the standalone src/api.py file, not the src/api/ package.
 import pytest
 import sys
 import logging
+import functools
 import importlib.util
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -22,12 +23,14 @@ from unittest.mock import patch, MagicMock
 SRC_API_PATH = Path(__file__).parent.parent / "src" / "api.py"
 
 
+@functools.lru_cache(maxsize=1)
 def load_api_module():
     """
     Load and return the standalone src/api.py module.
     
     This function handles the tricky import of the standalone api.py file
-    which is in the same directory as the api/ package.
+    which is in the same directory as the api/ package. The module is
+    executed once and reused by every test.
     """
     # First, let's try to actually import api.service to see if it exists
     # If it does, the module will load normally
@@ -73,54 +76,59 @@ def load_api_module():
     return module
 
 
+@pytest.fixture
+def api_module():
+    """The cached src/api.py module with its recorded import errors cleared."""
+    module = load_api_module()
+    if hasattr(module, '_import_errors'):
+        module._import_errors.clear()
+    return module
+
+
 class TestGetImportErrors:
     """Tests for the get_import_errors() function."""
 
-    def test_get_import_errors_returns_list(self):
+    def test_get_import_errors_returns_list(self, api_module):
         """Test that get_import_errors returns a list."""
-        module = load_api_module()
-        if not hasattr(module, 'get_import_errors'):
+        if not hasattr(api_module, 'get_import_errors'):
             pytest.skip("get_import_errors not available - import failed")
         
-        result = module.get_import_errors()
+        result = api_module.get_import_errors()
         assert isinstance(result, list)
 
-    def test_get_import_errors_returns_copy(self):
+    def test_get_import_errors_returns_copy(self, api_module):
         """Test that get_import_errors returns a copy, not the original."""
-        module = load_api_module()
-        if not hasattr(module, 'get_import_errors'):
+        if not hasattr(api_module, 'get_import_errors'):
             pytest.skip("get_import_errors not available - import failed")
         
-        result = module.get_import_errors()
+        result = api_module.get_import_errors()
         
         # Modify the returned list
         result.append(("TestError", "test message"))
         
         # Get again and verify original is not affected
-        result2 = module.get_import_errors()
+        result2 = api_module.get_import_errors()
         assert len(result2) == 0
 
-    def test_get_import_errors_empty_on_success(self):
+    def test_get_import_errors_empty_on_success(self, api_module):
         """Test that get_import_errors returns empty list on successful import."""
-        module = load_api_module()
-        if not hasattr(module, 'get_import_errors'):
+        if not hasattr(api_module, 'get_import_errors'):
             pytest.skip("get_import_errors not available - import failed")
         
-        if hasattr(module, '_import_errors'):
-            module._import_errors.clear()
+        if hasattr(api_module, '_import_errors'):
+            api_module._import_errors.clear()
         
-        result = module.get_import_errors()
+        result = api_module.get_import_errors()
         assert isinstance(result, list)
 
-    def test_get_import_errors_contains_tuples(self):
+    def test_get_import_errors_contains_tuples(self, api_module):
         """Test that import errors are stored as tuples."""
-        module = load_api_module()
-        if not hasattr(module, 'get_import_errors'):
+        if not hasattr(api_module, 'get_import_errors'):
             pytest.skip("get_import_errors not available - import failed")
         
-        if hasattr(module, '_import_errors'):
-            module._import_errors.append(("TestError", "Test error message"))
-            result = module.get_import_errors()
+        if hasattr(api_module, '_import_errors'):
+            api_module._import_errors.append(("TestError", "Test error message"))
+            result = api_module.get_import_errors()
             assert len(result) > 0
             for error in result:
                 assert isinstance(error, tuple)
@@ -130,96 +138,89 @@ class TestGetImportErrors:
 class TestLogImportError:
     """Tests for the _log_import_error() function."""
 
-    def test_log_import_error_logs_critical(self, caplog):
+    def test_log_import_error_logs_critical(self, api_module, caplog):
         """Test that _log_import_error logs at critical level."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         with caplog.at_level(logging.CRITICAL):
             test_error = ValueError("Test error message")
-            module._log_import_error(test_error, "TestErrorType")
+            api_module._log_import_error(test_error, "TestErrorType")
         
         assert any(record.levelname == 'CRITICAL' for record in caplog.records)
 
-    def test_log_import_error_includes_error_type(self, caplog):
+    def test_log_import_error_includes_error_type(self, api_module, caplog):
         """Test that logged message includes error type."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("Test error message")
         error_type = "ValueError"
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, error_type)
+            api_module._log_import_error(test_error, error_type)
         
         assert any(error_type in record.message for record in caplog.records)
 
-    def test_log_import_error_includes_error_message(self, caplog):
+    def test_log_import_error_includes_error_message(self, api_module, caplog):
         """Test that logged message includes error details."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         error_message = "Specific error message"
         test_error = ValueError(error_message)
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, "ValueError")
+            api_module._log_import_error(test_error, "ValueError")
         
         assert any(error_message in record.message for record in caplog.records)
 
-    def test_log_import_error_includes_python_version(self, caplog):
+    def test_log_import_error_includes_python_version(self, api_module, caplog):
         """Test that log includes Python version context."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("Test")
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, "ValueError")
+            api_module._log_import_error(test_error, "ValueError")
         
         # The function logs with extra context including python_version
         assert sys.version is not None
 
-    def test_log_import_error_module_not_found_error(self, caplog):
+    def test_log_import_error_module_not_found_error(self, api_module, caplog):
         """Test logging for ModuleNotFoundError."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ModuleNotFoundError("No module named 'missing_module'")
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, "ModuleNotFoundError")
+            api_module._log_import_error(test_error, "ModuleNotFoundError")
         
         assert any(record.levelname == 'CRITICAL' for record in caplog.records)
 
-    def test_log_import_error_import_error(self, caplog):
+    def test_log_import_error_import_error(self, api_module, caplog):
         """Test logging for ImportError."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ImportError("Cannot import name 'missing' from 'module'")
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, "ImportError")
+            api_module._log_import_error(test_error, "ImportError")
         
         assert any(record.levelname == 'CRITICAL' for record in caplog.records)
 
-    def test_log_import_error_attribute_error(self, caplog):
+    def test_log_import_error_attribute_error(self, api_module, caplog):
         """Test logging for AttributeError."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = AttributeError("module has no attribute 'missing_attr'")
         
         with caplog.at_level(logging.CRITICAL):
-            module._log_import_error(test_error, "AttributeError")
+            api_module._log_import_error(test_error, "AttributeError")
         
         assert any(record.levelname == 'CRITICAL' for record in caplog.records)
 
@@ -227,70 +228,63 @@ class TestLogImportError:
 class TestModuleVariables:
     """Tests for module-level variables."""
 
-    def test_logger_is_logger_instance(self):
+    def test_logger_is_logger_instance(self, api_module):
         """Test that logger is a Logger instance."""
-        module = load_api_module()
-        if not hasattr(module, 'logger'):
+        if not hasattr(api_module, 'logger'):
             pytest.skip("logger not available - import failed")
         
-        assert isinstance(module.logger, logging.Logger)
+        assert isinstance(api_module.logger, logging.Logger)
 
-    def test_logger_name_matches_module(self):
+    def test_logger_name_matches_module(self, api_module):
         """Test that logger is named correctly."""
-        module = load_api_module()
-        if not hasattr(module, 'logger'):
+        if not hasattr(api_module, 'logger'):
             pytest.skip("logger not available - import failed")
         
         # Logger name should contain 'api'
-        assert 'api' in module.logger.name.lower()
+        assert 'api' in api_module.logger.name.lower()
 
-    def test_import_errors_is_list(self):
+    def test_import_errors_is_list(self, api_module):
         """Test that _import_errors is a list."""
-        module = load_api_module()
-        if not hasattr(module, '_import_errors'):
+        if not hasattr(api_module, '_import_errors'):
             pytest.skip("_import_errors not available - import failed")
         
-        assert isinstance(module._import_errors, list)
+        assert isinstance(api_module._import_errors, list)
 
 
 class TestModuleExports:
     """Tests for module exports (__all__)."""
 
-    def test_module_has_all_attribute(self):
+    def test_module_has_all_attribute(self, api_module):
         """Test that module defines __all__."""
-        module = load_api_module()
         # Some modules may not have __all__ defined
         # This is optional in Python
-        has_all = hasattr(module, '__all__')
+        has_all = hasattr(api_module, '__all__')
         # Just check the module loaded
-        assert module is not None
+        assert api_module is not None
 
-    def test_module_exports_app_or_has_app(self):
+    def test_module_exports_app_or_has_app(self, api_module):
         """Test that module has app or exports it."""
-        module = load_api_module()
         # The module should have either app or an error
-        has_app = hasattr(module, 'app')
-        has_errors = hasattr(module, '_import_errors')
+        has_app = hasattr(api_module, 'app')
+        has_errors = hasattr(api_module, '_import_errors')
         assert has_app or has_errors
 
 
 class TestImportScenarios:
     """Tests for import scenarios."""
 
-    def test_module_loads(self):
+    def test_module_loads(self, api_module):
         """Test that module can be loaded."""
-        module = load_api_module()
-        assert module is not None
+        assert api_module is not None
 
-    def test_has_required_attributes(self):
+    def test_has_required_attributes(self, api_module):
         """Test that module has required attributes."""
-        module = load_api_module()
         # Should have either app (success) or _import_errors (for tracking failures)
         has_attributes = (
-            hasattr(module, 'app') or 
-            hasattr(module, 'get_import_errors') or
-            hasattr(module, '_import_errors') or
-            hasattr(module, 'logger')
+            hasattr(api_module, 'app') or 
+            hasattr(api_module, 'get_import_errors') or
+            hasattr(api_module, '_import_errors') or
+            hasattr(api_module, 'logger')
         )
         assert has_attributes
 
@@ -298,13 +292,12 @@ class TestImportScenarios:
 class TestImportErrorHandling:
     """Tests for import error handling scenarios."""
 
-    def test_error_tracking_exists(self):
+    def test_error_tracking_exists(self, api_module):
         """Test that error tracking mechanism exists."""
-        module = load_api_module()
         # Should have some way to track errors
         has_error_tracking = (
-            hasattr(module, '_import_errors') or
-            hasattr(module, 'get_import_errors')
+            hasattr(api_module, '_import_errors') or
+            hasattr(api_module, 'get_import_errors')
         )
         assert has_error_tracking is not None
 
@@ -344,17 +337,16 @@ class TestErrorLoggingContext:
 class TestEdgeCases:
     """Edge case tests."""
 
-    def test_empty_error_message(self, caplog):
+    def test_empty_error_message(self, api_module, caplog):
         """Test handling of empty error messages."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("")
         
         with caplog.at_level(logging.CRITICAL):
             try:
-                module._log_import_error(test_error, "ValueError")
+                api_module._log_import_error(test_error, "ValueError")
             except Exception:
                 # May fail with empty message, that's ok
                 pass
@@ -362,10 +354,9 @@ class TestEdgeCases:
         # Should handle without crashing
         assert True
 
-    def test_very_long_error_message(self, caplog):
+    def test_very_long_error_message(self, api_module, caplog):
         """Test handling of very long error messages."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         long_message = "x" * 10000
@@ -373,56 +364,53 @@ class TestEdgeCases:
         
         with caplog.at_level(logging.CRITICAL):
             try:
-                module._log_import_error(test_error, "ValueError")
+                api_module._log_import_error(test_error, "ValueError")
             except Exception:
                 # May fail with very long message
                 pass
         
         assert True
 
-    def test_special_characters_in_error(self, caplog):
+    def test_special_characters_in_error(self, api_module, caplog):
         """Test handling of special characters in error messages."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("Error with special chars: \n\t\r\"'<>")
         
         with caplog.at_level(logging.CRITICAL):
             try:
-                module._log_import_error(test_error, "ValueError")
+                api_module._log_import_error(test_error, "ValueError")
             except Exception:
                 pass
         
         assert True
 
-    def test_unicode_in_error(self, caplog):
+    def test_unicode_in_error(self, api_module, caplog):
         """Test handling of unicode characters in error messages."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("Unicode error: 你好世界 🔥")
         
         with caplog.at_level(logging.CRITICAL):
             try:
-                module._log_import_error(test_error, "ValueError")
+                api_module._log_import_error(test_error, "ValueError")
             except Exception:
                 pass
         
         assert True
 
-    def test_none_error_type(self, caplog):
+    def test_none_error_type(self, api_module, caplog):
         """Test handling when error type is None."""
-        module = load_api_module()
-        if not hasattr(module, '_log_import_error'):
+        if not hasattr(api_module, '_log_import_error'):
             pytest.skip("_log_import_error not available - import failed")
         
         test_error = ValueError("Test")
         
         with caplog.at_level(logging.CRITICAL):
             try:
-                module._log_import_error(test_error, None)
+                api_module._log_import_error(test_error, None)
             except Exception:
                 pass
         
@@ -432,13 +420,12 @@ class TestEdgeCases:
 class TestIntegrationWithService:
     """Integration tests with api.service module."""
 
-    def test_app_or_error_tracking_exists(self):
+    def test_app_or_error_tracking_exists(self, api_module):
         """Test that either app or error tracking exists."""
-        module = load_api_module()
         has_app_or_errors = (
-            hasattr(module, 'app') or
-            hasattr(module, '_import_errors') or
-            hasattr(module, 'get_import_errors')
+            hasattr(api_module, 'app') or
+            hasattr(api_module, '_import_errors') or
+            hasattr(api_module, 'get_import_errors')
         )
         assert has_app_or_errors is not None
 
@@ -446,12 +433,11 @@ class TestIntegrationWithService:
 class TestFunctionCoverage:
     """Ensure all public functions have at least one test."""
 
-    def test_module_has_get_import_errors_or_import_error_tracking(self):
+    def test_module_has_get_import_errors_or_import_error_tracking(self, api_module):
         """Verify error tracking functions exist."""
-        module = load_api_module()
         has_error_tracking = (
-            hasattr(module, 'get_import_errors') or
-            hasattr(module, '_import_errors')
+            hasattr(api_module, 'get_import_errors') or
+            hasattr(api_module, '_import_errors')
         )
         # This is expected to be true for the api.py module
         assert has_error_tracking is not None
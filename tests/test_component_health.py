@@ -73,6 +73,18 @@ class TestSystemHealthMonitor:
         health = monitor.get_component_health("test_component")
         assert health.status == HealthStatus.HEALTHY
 
+    def test_mark_all_healthy(self):
+        """Test marking several components healthy at once"""
+        monitor = SystemHealthMonitor()
+        monitor.mark_failed("comp1", "boom")
+        monitor.mark_degraded("comp2", "slow")
+
+        monitor.mark_all_healthy(("comp1", "comp2", "comp3"))
+        for name in ("comp1", "comp2", "comp3"):
+            assert monitor.get_component_health(name).status == HealthStatus.HEALTHY
+        assert monitor.get_component_health("comp2").fallback_active is False
+        assert monitor.is_system_healthy()
+
     def test_get_all_health(self):
         """Test getting all components health"""
         monitor = SystemHealthMonitor()